@@ -59,18 +59,39 @@ class GridFinder(GridMeasureFeatures, ABC):
         """
         pass
 
+    @staticmethod
+    def _assign_bins(positions: np.ndarray, edges: np.ndarray, nbins: int) -> pd.Categorical:
+        """
+        Bin positions the way ``pd.cut(..., include_lowest=True, right=True)`` does, without building interval labels.
+
+        Args:
+            positions (np.ndarray): Coordinates to bin.
+            edges (np.ndarray): Increasing bin edges, one more than the number of bins.
+            nbins (int): Number of bins.
+
+        Returns:
+            pd.Categorical: The bin number of each position, or missing if it falls outside the edges.
+        """
+        edges = np.asarray(edges, dtype=float)
+        if len(edges) != nbins + 1 or np.any(np.diff(edges) <= 0):
+            raise ValueError(f'Expected {nbins + 1} unique increasing bin edges, got {edges}')
+
+        positions = np.asarray(positions, dtype=float)
+        codes = np.searchsorted(edges, positions, side='left') - 1
+        codes[positions == edges[0]] = 0  # The lowest edge belongs to the first bin
+        codes[(codes < 0) | (codes >= nbins)] = -1
+        return pd.Categorical.from_codes(codes, categories=range(nbins), ordered=True)
+
     @staticmethod
     def _clip_row_edges(row_edges, imshape: (int, int, ...)) -> np.ndarray:
         return np.clip(a=row_edges, a_min=0, a_max=imshape[0])
 
     def _add_row_number_info(self, table: pd.DataFrame, row_edges: np.array, imshape: (int, int)) -> pd.DataFrame:
         row_edges = self._clip_row_edges(row_edges=row_edges, imshape=imshape)
-        table.loc[:, str(GRID.ROW_NUM)] = pd.cut(
-                table.loc[:, str(BBOX.CENTER_RR)],
-                bins=row_edges,
-                labels=range(self.nrows),
-                include_lowest=True,
-                right=True,
+        table.loc[:, str(GRID.ROW_NUM)] = self._assign_bins(
+                positions=table.loc[:, str(BBOX.CENTER_RR)].to_numpy(),
+                edges=row_edges,
+                nbins=self.nrows,
         )
         return table
 
@@ -80,12 +101,10 @@ class GridFinder(GridMeasureFeatures, ABC):
 
     def _add_col_number_info(self, table: pd.DataFrame, col_edges: np.array, imshape: (int, int)) -> pd.DataFrame:
         col_edges = self._clip_col_edges(col_edges=col_edges, imshape=imshape)
-        table.loc[:, str(GRID.COL_NUM)] = pd.cut(
-                table.loc[:, str(BBOX.CENTER_CC)],
-                bins=col_edges,
-                labels=range(self.ncols),
-                include_lowest=True,
-                right=True,
+        table.loc[:, str(GRID.COL_NUM)] = self._assign_bins(
+                positions=table.loc[:, str(BBOX.CENTER_CC)].to_numpy(),
+                edges=col_edges,
+                nbins=self.ncols,
         )
         return table
 
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 import uuid
 import warnings
-from copy import deepcopy
 from dataclasses import dataclass, field
 from types import SimpleNamespace
-from typing import Any, Literal, TYPE_CHECKING, Union
+from typing import Any, Literal, Tuple, TYPE_CHECKING, Union
 
 import numpy as np
-from scipy.sparse import csc_matrix
-from skimage.color import rgb2gray, rgba2rgb
+from scipy.sparse import csr_matrix
+from skimage.util import img_as_float32
 
 if TYPE_CHECKING:
     from phenotypic import Image
@@ -19,17 +18,72 @@ from phenotypic.tools.constants_ import IMAGE_MODE, METADATA, IMAGE_TYPES
 
 @dataclass
 class ImageData:
-    """Container for core image data representations."""
+    """Container for core image data representations.
+
+    Note:
+        - The gray of a color image is created lazily. Until it is first accessed or assigned, it
+          is implicitly the luminance of the rgb, so color-only workflows skip the conversion.
+        - The enhanced gray is created lazily. Until it is first accessed or assigned, it is
+          implicitly a copy of the gray, so images that are never enhanced skip the copy.
+        - hsv caches the HSV conversion of the rgb. It is None until first requested and is
+          cleared whenever the rgb changes.
+    """
     rgb: np.ndarray | None = None
-    gray: np.ndarray | None = None
-    enh_gray: np.ndarray | None = None
-    sparse_object_map: csc_matrix = None
+    _gray: np.ndarray | None = None
+    _enh_gray: np.ndarray | None = None
+    sparse_object_map: csr_matrix = None
+    hsv: np.ndarray | None = None
+
+    @property
+    def gray(self) -> np.ndarray | None:
+        if self._gray is None and self.rgb is not None:
+            self._gray = ImageDataManager._rgb2gray(self.rgb)
+        return self._gray
+
+    @gray.setter
+    def gray(self, value: np.ndarray | None):
+        self._gray = value
+
+    @property
+    def gray_shape(self) -> Tuple[int, ...] | None:
+        """The shape of the gray, without converting the rgb if the gray has not been created yet."""
+        if self._gray is not None:
+            return self._gray.shape
+        if self.rgb is not None:
+            return self.rgb.shape[:2]
+        return None
+
+    @property
+    def enh_gray(self) -> np.ndarray | None:
+        if self._enh_gray is None and self.gray is not None:
+            self._enh_gray = self.gray.copy()
+        return self._enh_gray
+
+    @enh_gray.setter
+    def enh_gray(self, value: np.ndarray | None):
+        self._enh_gray = value
+
+    def enh_gray_buffer(self, overwrite: bool = False) -> np.ndarray | None:
+        """Returns the enhanced gray array that writes should go to.
+
+        Args:
+            overwrite (bool): If True, the caller will overwrite every element. When the enhanced
+                gray has not been created yet, an uninitialized buffer is allocated instead of
+                copying the gray into it first.
+
+        Returns:
+            np.ndarray | None: The enhanced gray array.
+        """
+        if overwrite and self._enh_gray is None and self.gray is not None:
+            self._enh_gray = np.empty_like(self.gray)
+        return self.enh_gray
 
     def clear(self):
         self.rgb = np.empty((0, 3), dtype=np.uint8)
         self.gray = np.empty((0, 2), dtype=np.float32)
         self.enh_gray = np.empty((0, 2), dtype=np.float32)
-        self.sparse_object_map = csc_matrix((0, 0), dtype=np.uint16)
+        self.sparse_object_map = csr_matrix((0, 0), dtype=np.uint16)
+        self.hsv = None
 
 
 @dataclass
@@ -89,6 +143,9 @@ class ImageDataManager:
     _ARRAY16_DTYPE = np.uint16
     _OBJMAP_DTYPE = np.uint16
 
+    # Luminance weights used by skimage.color.rgb2gray
+    _GRAY_WEIGHTS = np.array([0.2125, 0.7154, 0.0721])
+
     def __init__(self,
                  name: str | None = None,
                  bit_depth: Literal[8, 16] | None = None):
@@ -145,28 +202,49 @@ class ImageDataManager:
         self._metadata.clear()
         return
 
-    def set_image(self, input_image: Image | np.ndarray) -> None:
+    def set_image(self,
+                  input_image: Image | np.ndarray | bytes | bytearray | memoryview,
+                  shape: tuple[int, ...] | None = None,
+                  dtype: np.dtype | type | None = None) -> None:
         """
         Sets the image for the object by processing the provided input, which can be either
-        a NumPy array or an instance of the Image class. If the input type is unsupported,
-        an exception is raised to notify the user.
+        a NumPy array, an instance of the Image class, or a raw pixel buffer. If the input type
+        is unsupported, an exception is raised to notify the user.
+
+        Raw buffers (e.g. from a decoder or camera SDK) are wrapped with np.frombuffer without
+        copying, so `shape` and `dtype` must describe the pixel layout of the buffer.
+
+        Note:
+            - A writeable buffer (bytearray, writeable memoryview) may be shared with a grayscale
+              image's gray data, so later changes to the buffer are visible in the image. Pass a
+              copy if that is not wanted. Read-only buffers such as bytes are copied.
 
         Args:
-            input_image: A NumPy array or an instance of the Image class representing
-                the image to be set.
+            input_image: A NumPy array, an instance of the Image class, or a bytes-like buffer
+                representing the image to be set.
+            shape (tuple[int, ...] | None): Shape of the image in a raw buffer, e.g. (H, W) or
+                (H, W, C). Required for buffer input and ignored otherwise.
+            dtype (np.dtype | type | None): Pixel dtype of a raw buffer, e.g. np.uint8. Required
+                for buffer input and ignored otherwise.
 
         Raises:
-            ValueError: If the input is not a NumPy array or an Image instance.
+            ValueError: If the input is not a NumPy array, an Image instance, or a buffer, or if
+                a buffer is given without `shape` and `dtype`.
         """
         match input_image:
             case x if isinstance(x, np.ndarray):
                 self._handle_array_input(x)
 
+            case x if isinstance(x, (bytes, bytearray, memoryview)):
+                if shape is None or dtype is None:
+                    raise ValueError('shape and dtype are required when setting an image from a raw buffer')
+                self._handle_array_input(np.frombuffer(x, dtype=dtype).reshape(shape))
+
             case x if self._is_image_handler(x):
                 self._set_from_class_instance(x)
             case _:
                 raise ValueError(
-                        f'Input must be a NumPy array, Image instance. Got {type(input_image)}'
+                        f'Input must be a NumPy array, Image instance, or raw buffer. Got {type(input_image)}'
                 )
 
     def _handle_array_input(self, arr: np.ndarray):
@@ -222,18 +300,19 @@ class ImageDataManager:
         if not self._is_image_handler(input_cls):
             raise ValueError('Input is not an Image object')
 
-        # Determine format from whether RGB data exists
-        if not input_cls.rgb.isempty():
-            self._set_from_array(input_cls.rgb[:])
-        else:
-            self._set_from_array(input_cls.gray[:])
-
-        # Deep copy all data attributes
+        # Copy each data component directly. The source's gray form was already derived from
+        # its rgb form, so there is no need to run the color conversion again. The hsv cache is
+        # read-only and the sparse object map is always replaced rather than modified in place,
+        # so both are shared rather than copied.
         for key, value in input_cls._data.__dict__.items():
-            self._data.__dict__[key] = value.copy() if value is not None else None
+            if value is None or key in ('hsv', 'sparse_object_map'):
+                self._data.__dict__[key] = value
+            else:
+                self._data.__dict__[key] = value.copy()
 
-        self._metadata.protected = deepcopy(input_cls._metadata.protected)
-        self._metadata.public = deepcopy(input_cls._metadata.public)
+        # Protected and public values are scalars, so a shallow copy is already independent
+        self._metadata.protected = dict(input_cls._metadata.protected)
+        self._metadata.public = dict(input_cls._metadata.public)
 
     def _set_from_matrix(self, matrix: np.ndarray):
         """Initialize 2-D image components from a matrix.
@@ -241,11 +320,16 @@ class ImageDataManager:
         Args:
             matrix (np.ndarray): A 2-D array form of an image.
         """
-        self._data.gray = matrix
-        self._data.enh_gray = matrix.copy()
-        self._data.sparse_object_map = csc_matrix(
-                np.zeros(matrix.shape, dtype=self._OBJMAP_DTYPE)
-        )
+        # Read-only inputs (e.g. wrapped bytes) are copied so the gray stays writeable
+        self._data.gray = np.require(matrix, requirements='W')
+        self._reset_derived_data()
+
+    def _reset_derived_data(self) -> None:
+        """Reset the components that are derived from the gray."""
+        # The enhanced gray is copied from the gray on first access
+        self._data.enh_gray = None
+        # Build the empty map from its shape rather than from a dense array of zeros
+        self._data.sparse_object_map = csr_matrix(self._data.gray_shape, dtype=self._OBJMAP_DTYPE)
 
     def _set_from_rgb(self, rgb_array: np.ndarray):
         """Initialize all components from an RGB array.
@@ -254,7 +338,46 @@ class ImageDataManager:
             rgb_array (np.ndarray): RGB image array.
         """
         self._data.rgb = rgb_array.copy()
-        self._set_from_matrix(rgb2gray(rgb_array))
+        self._sync_gray_from_rgb()
+
+    def _sync_gray_from_rgb(self) -> None:
+        """Mark the 2-D components as derived from the stored rgb array.
+
+        Used after the rgb data is set or written in place. The gray is only converted from the
+        rgb when it is first accessed.
+        """
+        self._data.hsv = None
+        self._data.gray = None
+        self._reset_derived_data()
+
+    def _set_from_single_channel(self, single_channel_array: np.ndarray):
+        """Initialize 2-D image components from a single channel 3-D array.
+
+        Args:
+            single_channel_array (np.ndarray): An array of shape (H, W, 1).
+        """
+        self._set_from_matrix(single_channel_array[:, :, 0])
+
+    def _set_from_rgba(self, rgba_array: np.ndarray):
+        """Initialize all components from an RGBA array.
+
+        Args:
+            rgba_array (np.ndarray): RGBA image array.
+        """
+        # The blended array is already a new buffer, so it does not need the copy in _set_from_rgb
+        self._data.rgb = self._rgba2rgb(rgba_array)
+        self._sync_gray_from_rgb()
+
+    # Maps each detected format to the name of the method that initializes the image from it
+    _FORMAT_DISPATCH = {
+        IMAGE_MODE.GRAYSCALE               : '_set_from_matrix',
+        IMAGE_MODE.GRAYSCALE_SINGLE_CHANNEL: '_set_from_single_channel',
+        IMAGE_MODE.RGB                     : '_set_from_rgb',
+        IMAGE_MODE.RGB_OR_BGR              : '_set_from_rgb',
+        IMAGE_MODE.LINEAR_RGB              : '_set_from_rgb',
+        IMAGE_MODE.RGBA                    : '_set_from_rgba',
+        IMAGE_MODE.RGBA_OR_BGRA            : '_set_from_rgba',
+    }
 
     def _set_from_array(self, imarr: np.ndarray) -> None:
         """Initialize all components from an array.
@@ -266,23 +389,75 @@ class ImageDataManager:
         format_enum = self._guess_image_format(imarr)
 
         # Process based on detected format
-        match format_enum:
-            case IMAGE_MODE.GRAYSCALE | IMAGE_MODE.GRAYSCALE_SINGLE_CHANNEL:
-                self._set_from_matrix(
-                        imarr if imarr.ndim == 2 else imarr[:, :, 0]
-                )
+        handler_name = self._FORMAT_DISPATCH.get(format_enum)
+        if handler_name is None:
+            raise ValueError(f'Unsupported image format: {format_enum}')
+        getattr(self, handler_name)(imarr)
 
-            case IMAGE_MODE.RGB | IMAGE_MODE.RGB_OR_BGR:
-                self._set_from_rgb(imarr)
+    @staticmethod
+    def _ensure_float32(arr: np.ndarray) -> np.ndarray:
+        """Convert an array to normalized float32 before color-space math.
 
-            case IMAGE_MODE.LINEAR_RGB:
-                self._set_from_rgb(imarr)
+        skimage's color conversions promote integer inputs to float64. Converting
+        once to float32 here keeps the conversions in single precision, which halves
+        the memory traffic without affecting detection accuracy.
 
-            case IMAGE_MODE.RGBA | IMAGE_MODE.RGBA_OR_BGRA:
-                self._set_from_rgb(rgba2rgb(imarr))
+        Args:
+            arr (np.ndarray): Input image array.
 
-            case _:
-                raise ValueError(f'Unsupported image format: {format_enum}')
+        Returns:
+            np.ndarray: The array as float32 scaled to [0, 1]. Float32 inputs are
+                returned without copying.
+        """
+        return img_as_float32(arr)
+
+    @classmethod
+    def _rgb2gray(cls, rgb_array: np.ndarray) -> np.ndarray:
+        """Compute the float32 luminance of an RGB array.
+
+        Uses the same weights as skimage.color.rgb2gray, but applies them channel by
+        channel in single precision. The elementwise form gives identical values for
+        an image and any slice of it, which a BLAS matmul does not guarantee.
+
+        Unsigned integer inputs are read directly with the bit depth scaling folded into
+        the weights, so no float copy of the full color array is made.
+
+        Args:
+            rgb_array (np.ndarray): RGB image array of shape (H, W, 3).
+
+        Returns:
+            np.ndarray: float32 grayscale matrix with values in [0, 1].
+        """
+        if rgb_array.dtype.kind == 'u':
+            rgb = rgb_array
+            weights = (cls._GRAY_WEIGHTS/np.iinfo(rgb_array.dtype).max).astype(np.float32)
+        else:
+            rgb = cls._ensure_float32(rgb_array)
+            weights = cls._GRAY_WEIGHTS.astype(np.float32)
+        gray = np.multiply(rgb[..., 0], weights[0], dtype=np.float32)
+        gray += np.multiply(rgb[..., 1], weights[1], dtype=np.float32)
+        gray += np.multiply(rgb[..., 2], weights[2], dtype=np.float32)
+        return gray
+
+    @classmethod
+    def _rgba2rgb(cls, rgba_array: np.ndarray) -> np.ndarray:
+        """Blend an RGBA array onto a white background.
+
+        Equivalent to skimage.color.rgba2rgb with the default background, but the blend
+        ``alpha*rgb + (1 - alpha)`` is rewritten as ``(rgb - 1)*alpha + 1`` and evaluated in
+        place on a single float32 buffer instead of allocating a temporary per term.
+
+        Args:
+            rgba_array (np.ndarray): RGBA image array of shape (H, W, 4).
+
+        Returns:
+            np.ndarray: float32 RGB array with values in [0, 1].
+        """
+        rgba = cls._ensure_float32(rgba_array)
+        rgb = np.subtract(rgba[..., :3], 1.0, dtype=np.float32)
+        rgb *= rgba[..., 3:4]
+        rgb += 1.0
+        return rgb
 
     @staticmethod
     def _guess_image_format(img: np.ndarray) -> IMAGE_MODE:
@@ -336,10 +511,12 @@ class ImageDataManager:
         if bit_depth not in (8, 16):
             raise ValueError(f"bit_depth must be 8 or 16, got {bit_depth}")
 
-        if np.any(float_array < 0) or np.any(float_array > 1):
+        # Reduce to the extrema once instead of building boolean temporaries for each bound
+        arr_min, arr_max = float_array.min(), float_array.max()
+        if arr_min < 0 or arr_max > 1:
             raise ValueError(
                     f"Float array contains values outside [0, 1] range. "
-                    f"Min: {float_array.min()}, Max: {float_array.max()}"
+                    f"Min: {arr_min}, Max: {arr_max}"
             )
 
         if bit_depth == 8:
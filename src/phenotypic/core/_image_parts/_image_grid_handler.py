@@ -4,13 +4,13 @@ from typing import Union, Tuple, Type, Optional
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.collections import PatchCollection
 from matplotlib.patches import Rectangle
 
 from phenotypic.abc_ import GridFinder
 from phenotypic.core._image_parts.accessors import GridAccessor
 from phenotypic.grid import AutoGridFinder
-from phenotypic.measure import MeasureBounds
-from phenotypic.tools.constants_ import IMAGE_TYPES, BBOX, METADATA
+from phenotypic.tools.constants_ import IMAGE_TYPES, BBOX, GRID, METADATA
 from phenotypic.tools.exceptions_ import IllegalAssignmentError
 from .._image import Image
 
@@ -235,27 +235,23 @@ class ImageGridHandler(Image):
 
             cmap = plt.get_cmap('tab20')
             cmap_cycle = cycle(cmap(i) for i in range(cmap.N))
-            img = self.copy()
-            img.objmap = self.grid.get_section_map()
-            gs_table = MeasureBounds().measure(img)
+            # The bounding box of a section's objects spans the bounding boxes of its members
+            gs_table = (self.grid.info(include_metadata=False)
+                        .groupby(str(GRID.SECTION_NUM))
+                        .agg({str(BBOX.MIN_RR): 'min', str(BBOX.MAX_RR): 'max',
+                              str(BBOX.MIN_CC): 'min', str(BBOX.MAX_CC): 'max'}))
 
             # Add squares that denote object grid belonging. Useful for cases where objects are larger than grid sections
-            for obj_label in gs_table.index.unique():
-                subtable = gs_table.loc[obj_label, :]
-                min_rr = subtable.loc[str(BBOX.MIN_RR)]
-                max_rr = subtable.loc[str(BBOX.MAX_RR)]
-                min_cc = subtable.loc[str(BBOX.MIN_CC)]
-                max_cc = subtable.loc[str(BBOX.MAX_CC)]
-
-                width = max_cc - min_cc
-                height = max_rr - min_rr
-
-                ax.add_patch(
-                        Rectangle(
-                                (min_cc, min_rr), width=width, height=height,
-                                edgecolor=next(cmap_cycle),
-                                facecolor='none',
-                        ),
-                )
+            bounds = gs_table.loc[:, [str(BBOX.MIN_RR), str(BBOX.MAX_RR),
+                                      str(BBOX.MIN_CC), str(BBOX.MAX_CC)]].to_numpy()
+            rects = [Rectangle((min_cc, min_rr), width=max_cc - min_cc, height=max_rr - min_rr)
+                     for min_rr, max_rr, min_cc, max_cc in bounds]
+            ax.add_collection(
+                    PatchCollection(
+                            rects,
+                            edgecolors=[next(cmap_cycle) for _ in rects],
+                            facecolors='none',
+                    ),
+            )
 
         return fig, ax
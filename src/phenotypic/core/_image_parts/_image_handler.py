@@ -102,11 +102,18 @@ class ImageHandler(ImageDataManager):
         """
         if not self.rgb.isempty():
             subimage = self.__class__(arr=self.rgb[key])
+            # The gray of a slice is the slice of the gray, so an existing gray is sliced
+            # instead of converting the rgb of the subimage again
+            if self._data._gray is not None:
+                subimage._data.gray = self._data._gray[key].copy()
         else:
             subimage = self.__class__(arr=self.gray[key])
 
-        subimage.enh_gray[:] = self.enh_gray[key].copy()
-        subimage.objmap[:] = self.objmap[key].copy()
+        # An enhanced gray that was never created stays a lazy copy of the subimage's gray
+        if self._data._enh_gray is not None:
+            subimage._data.enh_gray = self._data._enh_gray[key].copy()
+        # Slicing the sparse map directly avoids densifying the whole map of the parent
+        subimage._data.sparse_object_map = self._data.sparse_object_map[key]
         subimage.metadata[METADATA.IMAGE_TYPE] = IMAGE_TYPES.CROP.value
         return subimage
 
@@ -125,24 +132,36 @@ class ImageHandler(ImageDataManager):
 
         # Sections can only be set to another Image class
         if isinstance(other_image, self.__class__) or issubclass(type(other_image), ImageHandler):
-            # Handle the rgb case
-            if not other_image.rgb.isempty() and not self.rgb.isempty():
-                if np.array_equal(self.rgb[key].shape, other_image.rgb.shape) is False:
-                    raise ValueError(
-                            'The image being set must be of the same shape as the image elements being accessed.',
-                    )
-                else:
-                    self._data.rgb[key] = other_image._data.rgb[:]
-
-            # handle other cases
-            if np.array_equal(self.gray[key].shape, other_image.gray.shape) is False:
+            self._set_pixel_data(key, other_image)
+            self.objmask[key] = other_image.objmask[:]
+
+    def _set_pixel_data(self, key, other_image):
+        """Writes the rgb, gray, and enhanced gray of another image into a section of this one.
+
+        The object mask is left untouched, so callers writing many sections can relabel the
+        objects once at the end instead of after every section.
+
+        Raises:
+            ValueError: If the shape of the other image does not match the section being set.
+        """
+        # Handle the rgb case
+        if not other_image.rgb.isempty() and not self.rgb.isempty():
+            if np.array_equal(self.rgb[key].shape, other_image.rgb.shape) is False:
                 raise ValueError(
                         'The image being set must be of the same shape as the image elements being accessed.',
                 )
             else:
-                self._data.gray[key] = other_image._data.gray[:]
-                self._data.enh_gray[key] = other_image._data.enh_gray[:]
-                self.objmask[key] = other_image.objmask[:]
+                self._data.rgb[key] = other_image._data.rgb[:]
+                self._data.hsv = None
+
+        # handle other cases
+        if np.array_equal(self.gray[key].shape, other_image.gray.shape) is False:
+            raise ValueError(
+                    'The image being set must be of the same shape as the image elements being accessed.',
+            )
+        else:
+            self._data.gray[key] = other_image._data.gray[:]
+            self._data.enh_gray[key] = other_image._data.enh_gray[:]
 
     def __eq__(self, other: Image) -> bool:
         """
@@ -154,6 +173,9 @@ class ImageHandler(ImageDataManager):
 
         Note:
             - Only checks core image data, and not any other attributes such as metadata.
+            - The cheap format and shape checks run first, and the comparison stops at the first
+              difference. Grays that have not been created yet are not converted, and the object
+              maps are compared in sparse form.
 
         Args:
             other: The object to compare with the current instance.
@@ -162,20 +184,28 @@ class ImageHandler(ImageDataManager):
             bool: True if all the attributes of the current object are identical to those
             of the `other` object. Returns False otherwise.
         """
-        # Check if both images have the same format (RGB vs grayscale)
-        format_match = (self.rgb.isempty() == other.rgb.isempty())
+        if self is other:
+            return True
 
-        # Check RGB arrays: equal if both present and matching, or both absent
+        # Check if both images have the same format (RGB vs grayscale) and size
         self_has_rgb = not self.rgb.isempty()
-        other_has_rgb = not other.rgb.isempty()
+        if self_has_rgb == other.rgb.isempty() or self._data.gray_shape != other._data.gray_shape:
+            return False
+
+        if self_has_rgb and not np.array_equal(self._data.rgb, other._data.rgb):
+            return False
+
+        # An uncreated gray is derived from the rgb, which is equal at this point, and an
+        # uncreated enhanced gray is a copy of the gray, which is compared just before it
+        if (self._data._gray is not None or other._data._gray is not None) and \
+                not np.array_equal(self._data.gray, other._data.gray):
+            return False
 
-        rgb_check = (
-                (self_has_rgb == other_has_rgb) and
-                (not self_has_rgb or np.array_equal(self.rgb[:], other.rgb[:]))
-        )
+        if (self._data._enh_gray is not None or other._data._enh_gray is not None) and \
+                not np.array_equal(self._data.enh_gray, other._data.enh_gray):
+            return False
 
-        return format_match and rgb_check and np.array_equal(self.gray[:], other.gray[:]) and np.array_equal(
-                self.enh_gray[:], other.enh_gray[:]) and np.array_equal(self.objmap[:], other.objmap[:])
+        return (self._data.sparse_object_map != other._data.sparse_object_map).nnz == 0
 
     def __ne__(self, other):
         return not self == other
@@ -302,7 +332,7 @@ class ImageHandler(ImageDataManager):
 
         See Also: :class:`ImageMatrix`
         """
-        if self._data.gray is None:
+        if self._data.gray_shape is None:
             raise EmptyImageError
         else:
             return self._accessors.gray
@@ -399,7 +429,7 @@ class ImageHandler(ImageDataManager):
     def objmap(self) -> ObjectMap:
         """Returns the ObjectMap accessor; The object map is a mutable integer gray that identifies the different objects in an image to be analyzed. Changes to elements of the object_map sync to the object_mask.
 
-        The object_map is stored as a compressed sparse column gray in the backend. This is to save on memory consumption at the cost of adding
+        The object_map is stored as a compressed sparse row matrix in the backend, matching the row-major layout of the image arrays. This is to save on memory consumption at the cost of adding
         increased computational overhead between converting between sparse and dense matrices.
 
         Note:
@@ -441,9 +471,9 @@ class ImageHandler(ImageDataManager):
         """Fetches the properties of the whole image.
 
         Calculates region properties for the entire image using the gray representation.
-        The labeled image is generated as a full array with values of 1, and the
-        intensity image corresponds to the `_data.gray` attribute of the object.
-        Cache is disabled in this configuration.
+        The labeled image is a read-only broadcast of a single label of 1 over the gray shape,
+        so no image-sized label array is allocated, and the intensity image corresponds to the
+        `_data.gray` attribute of the object. Cache is disabled in this configuration.
 
         Returns:
             list[skimage.measure._regionprops.RegionProperties]: A list of properties for the entire provided image.
@@ -612,7 +642,8 @@ class ImageHandler(ImageDataManager):
 
 
         """
-        return ski.measure.regionprops(label_image=np.full(shape=self.shape, fill_value=1),
+        whole_image_label = np.broadcast_to(np.uint8(1), self._data.gray.shape)
+        return ski.measure.regionprops(label_image=whole_image_label,
                                        intensity_image=self._data.gray, cache=False)
 
     @property
@@ -620,7 +651,6 @@ class ImageHandler(ImageDataManager):
         """Returns the number of objects in the image
         Note:
         """
-        self._data.sparse_object_map.eliminate_zeros()
         object_labels = np.unique(self._data.sparse_object_map.data)
         return len(object_labels[object_labels != 0])
 
@@ -628,6 +658,7 @@ class ImageHandler(ImageDataManager):
         """Creates a copy of the current Image instance, excluding the UUID.
         Note:
             - The new instance is only informationally a copy. The UUID of the new instance is different.
+            - Each data component is copied directly, so color conversions are not recomputed.
 
         Returns:
             Image: A copy of the current Image instance.
@@ -635,13 +666,9 @@ class ImageHandler(ImageDataManager):
         # Create a new instance of ImageHandler
         return self.__class__(self)
 
-    def _set_from_matrix(self, matrix: np.ndarray):
-        """Override parent to also reset accessors after setting matrix data.
-        
-        Args:
-            matrix (np.ndarray): A 2-D array form of an image.
-        """
-        super()._set_from_matrix(matrix)
+    def _reset_derived_data(self) -> None:
+        """Override parent to also reset accessors after the gray changes."""
+        super()._reset_derived_data()
         self._accessors.enh_gray.reset()
         self._accessors.objmap.reset()
 
@@ -748,20 +775,27 @@ class ImageHandler(ImageDataManager):
         Returns:
             None
         """
+        # Create the gray from the unrotated rgb before the rgb is replaced. An enhanced gray that
+        # was never created stays unset, since a copy of the rotated gray is the same as rotating a copy.
+        gray, enh_gray = self._data.gray, self._data._enh_gray
         if not self.rgb.isempty():
             self._data.rgb = skimage_rotate(image=self._data.rgb, angle=angle_of_rotation, mode=mode, clip=True,
                                             cval=cval, order=order, preserve_range=preserve_range)
+            self._data.hsv = None
 
-        self._data.gray = skimage_rotate(image=self._data.gray, angle=angle_of_rotation, mode=mode, clip=True,
+        self._data.gray = skimage_rotate(image=gray, angle=angle_of_rotation, mode=mode, clip=True,
                                          cval=cval, order=order, preserve_range=preserve_range)
 
-        self._data.enh_gray = skimage_rotate(image=self._data.enh_gray, angle=angle_of_rotation, mode=mode,
-                                             clip=True, cval=cval, order=order, preserve_range=preserve_range)
+        if enh_gray is not None:
+            self._data.enh_gray = skimage_rotate(image=enh_gray, angle=angle_of_rotation, mode=mode,
+                                                 clip=True, cval=cval, order=order, preserve_range=preserve_range)
 
         # Rotate the object map while preserving the details and using nearest-neighbor interpolation
-        # This one must be nearest-neighbor
-        self.objmap[:] = ndimage.rotate(input=self.objmap[:], angle=angle_of_rotation, mode='constant', cval=0, order=0,
-                                        reshape=False)
+        # This one must be nearest-neighbor. The rotated labels are stored directly, since the
+        # dense read-modify-write in ObjectMap.__setitem__ is not needed for a full replacement.
+        rotated_map = ndimage.rotate(input=self._data.sparse_object_map.toarray(), angle=angle_of_rotation,
+                                     mode='constant', cval=0, order=0, reshape=False)
+        self._data.sparse_object_map = ObjectMap._dense_to_sparse(rotated_map)
 
     def reset(self) -> Type[Image]:
         """
@@ -171,13 +171,18 @@ class ImageAccessorBase(ABC):
             copy: Optional copy parameter for NumPy 2.0+ compatibility
             
         Returns:
-            np.ndarray: The underlying array data
+            np.ndarray: The underlying array data. When no copy is made, a read-only view is
+                returned so that the image data can only be changed through the accessor.
         """
-        arr = self._subject_arr
+        subject = self._subject_arr
+        arr = subject
         if dtype is not None:
             arr = arr.astype(dtype, copy=False if copy is None else copy)
         elif copy:
             arr = arr.copy()
+        if arr is subject:
+            arr = subject.view()
+            arr.flags.writeable = False
         return arr
 
     def __len__(self) -> int:
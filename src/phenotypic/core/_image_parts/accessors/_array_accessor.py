@@ -85,8 +85,8 @@ class ImageRGB(MultiChannelAccessor):
                     f'Unsupported type for setting the array. Value should be scalar or a numpy array: {type(value)}')
 
         self._root_image._data.rgb[key] = value
-        self._root_image._set_from_array(self._root_image._data.rgb)
+        self._root_image._sync_gray_from_rgb()
 
     @property
     def _subject_arr(self):
-        return self._root_image._data.rgb.copy()
+        return self._root_image._data.rgb
@@ -50,15 +50,19 @@ class EnhancedGrayscale(SingleChannelAccessor):
                 does not match the shape associated with the specified key.
             TypeError: If the provided value is neither a scalar (int or float) nor a numpy array.
         """
+        # The enhanced gray always has the same shape as the gray, so validate against the gray
+        # without forcing a deferred enhanced gray copy
         if isinstance(value, np.ndarray):
-            if self._root_image._data.enh_gray[key].shape != value.shape: raise ArrayKeyValueShapeMismatchError
+            if self._root_image._data.gray[key].shape != value.shape: raise ArrayKeyValueShapeMismatchError
         elif isinstance(value, (int, float)):
             pass
         else:
             raise TypeError(
                     f'Unsupported type for setting the gray. Value should be scalar or a numpy array: {type(value)}')
 
-        self._root_image._data.enh_gray[key] = value
+        # A full assignment overwrites every element, so a deferred copy of the gray is not needed
+        overwrite = key is Ellipsis or (isinstance(key, slice) and key == slice(None))
+        self._root_image._data.enh_gray_buffer(overwrite=overwrite)[key] = value
         self._root_image.objmap.reset()
 
     @property
@@ -66,5 +70,9 @@ class EnhancedGrayscale(SingleChannelAccessor):
         return self._root_image._data.enh_gray
 
     def reset(self):
-        """Resets the image's enhanced gray to the original gray representation."""
-        self._root_image._data.enh_gray = self._root_image._data.gray.copy()
+        """Resets the image's enhanced gray to the original gray representation.
+
+        Note:
+            - The copy of the gray is deferred until the enhanced gray is next accessed.
+        """
+        self._root_image._data.enh_gray = None
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Tuple
+
 import numpy as np
 
 from phenotypic.core._image_parts.accessor_abstracts import SingleChannelAccessor
@@ -65,6 +67,11 @@ class Grayscale(SingleChannelAccessor):
         self._root_image.enh_gray.reset()
         self._root_image.objmap.reset()
 
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        # Read from the data so the gray of a color image is not converted just for its shape
+        return self._root_image._data.gray_shape
+
     @property
     def _subject_arr(self) -> np.ndarray:
         return self._root_image._data.gray
@@ -14,6 +14,7 @@ import phenotypic
 from phenotypic.core._image_parts.accessor_abstracts import ImageAccessorBase
 from phenotypic.tools.constants_ import METADATA, IMAGE_TYPES, BBOX, GRID, OBJECT
 from phenotypic.tools.exceptions_ import NoObjectsError
+from phenotypic.tools.funcs_ import label_membership
 
 
 class GridAccessor(ImageAccessorBase):
@@ -69,10 +70,46 @@ class GridAccessor(ImageAccessorBase):
         ```
     """
 
+    _RELABEL_COLUMNS = (str(GRID.ROW_NUM), str(GRID.COL_NUM), str(GRID.SECTION_NUM))
+
     def __init__(self, root_image: GridImage):
         super().__init__(root_image)
         self._root_image: GridImage = root_image
 
+        # Grid results are reused until the object map or the grid finder settings change
+        self._cache: dict = {}
+        self._cache_key: tuple | None = None
+
+    def _get_cache_key(self) -> tuple:
+        """Internal method: returns the state the cached grid results depend on.
+
+        The object map is replaced, never modified in place, whenever objects change, so it is
+        tracked by identity. The grid finder is tracked by identity and by its attribute values.
+        """
+        grid_finder = self._root_image.grid_finder
+        finder_state = tuple(
+                (name, value.tobytes() if isinstance(value, np.ndarray) else value)
+                for name, value in sorted(vars(grid_finder).items())
+        )
+        return self._root_image._data.sparse_object_map, grid_finder, finder_state
+
+    def _cached(self, name: str, compute):
+        """Internal method: returns the cached result for name, computing it if the grid state changed.
+
+        Args:
+            name (str): Name of the cached result.
+            compute (Callable[[], Any]): Function that computes the result.
+        """
+        key = self._get_cache_key()
+        cached_key = self._cache_key
+        if cached_key is None or cached_key[0] is not key[0] or cached_key[1] is not key[1] \
+                or cached_key[2] != key[2]:
+            self._cache = {}
+            self._cache_key = key
+        if name not in self._cache:
+            self._cache[name] = compute()
+        return self._cache[name]
+
     @property
     def nrows(self) -> int:
         """Get the number of rows in the grid.
@@ -160,21 +197,11 @@ class GridAccessor(ImageAccessorBase):
             grid_info_minimal = grid_image.grid.info(include_metadata=False)
             ```
         """
-        info = self._root_image.grid_finder.measure(self._root_image)
+        info = self._cached('info', lambda: self._root_image.grid_finder.measure(self._root_image))
         if include_metadata:
             return self._root_image.metadata.insert_metadata(info)
         else:
-            return info
-
-    @property
-    def _idx_ref_matrix(self):
-        """Internal property: matrix mapping grid positions to flattened indices.
-
-        Returns:
-            np.ndarray: 2D array of shape (nrows, ncols) where element [i, j] contains
-                the flattened index for that grid position.
-        """
-        return np.reshape(np.arange(self.nrows*self.ncols), newshape=(self.nrows, self.ncols))
+            return info.copy()
 
     def __getitem__(self, idx):
         """Extract a grid section as a subimage.
@@ -232,8 +259,10 @@ class GridAccessor(ImageAccessorBase):
             if len(idx) != 2:
                 raise IndexError('Grid section index tuple must have length 2: (row, col).')
             row_idx, col_idx = idx
-            # This will naturally raise IndexError for out-of-range indices
-            idx = int(self._idx_ref_matrix[row_idx, col_idx])
+            if not (-self.nrows <= row_idx < self.nrows and -self.ncols <= col_idx < self.ncols):
+                raise IndexError(f'Grid section index {(row_idx, col_idx)} is out of bounds for a '
+                                 f'{self.nrows}x{self.ncols} grid.')
+            idx = (row_idx%self.nrows)*self.ncols + col_idx%self.ncols
 
         if self._root_image.objects.num_objects != 0:
             min_coords, max_coords = self._adv_get_grid_section_slices(idx)
@@ -244,7 +273,7 @@ class GridAccessor(ImageAccessorBase):
 
             # Remove objects that don't belong in that grid section from the subimage
             objmap = section_image.objmap[:]
-            objmap[~np.isin(objmap, self._get_section_labels(idx))] = 0
+            objmap[~label_membership(objmap, self._get_section_labels(idx))] = 0
             section_image.objmap = objmap
             section_image.metadata[METADATA.IMAGE_TYPE] = IMAGE_TYPES.GRID_SECTION.value
 
@@ -310,30 +339,49 @@ class GridAccessor(ImageAccessorBase):
         else:
             raise ValueError('Axis should be 0 or 1.')
 
-        # create persistent grid_info
-        grid_info = self.info()
-
-        # allocate empty vectors to store m & b for all values
-        m_slope = np.full(shape=num_vectors, fill_value=np.nan)
-        b_intercept = np.full(shape=num_vectors, fill_value=np.nan)
+        # The fit only depends on the grid info, so it is reused until the grid state changes
+        m_slope, b_intercept = self._cached(
+                f'centroid_alignment_{axis}',
+                lambda: self._fit_centroid_alignment(axis, num_vectors, x_group, x_val, y_val),
+        )
+        return m_slope.copy(), b_intercept.copy()
 
-        # Collect slope & intercept for the nrows or columns
-        # Use 2D covariance/variance method for finding linear regression
-        for idx in range(num_vectors):
-            x = grid_info.loc[grid_info.loc[:, x_group] == idx, x_val].to_numpy()
-            x_mean = np.mean(x) if x.size > 0 else np.nan
+    def _fit_centroid_alignment(self, axis: int, num_vectors: int, x_group: str, x_val: str,
+                                y_val: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Internal method: fit a line through the object centers of every row or column.
 
-            y = grid_info.loc[grid_info.loc[:, x_group] == idx, y_val].to_numpy()
-            y_mean = np.mean(y) if y.size > 0 else np.nan
+        Args:
+            axis (int): 0 to fit along rows, 1 to fit along columns.
+            num_vectors (int): Number of rows or columns in the grid.
+            x_group (str): Grid info column holding each object's row or column number.
+            x_val (str): Grid info column used as the independent variable.
+            y_val (str): Grid info column used as the dependent variable.
 
-            covariance = ((x - x_mean)*(y - y_mean)).sum()
-            variance = ((x - x_mean) ** 2).sum()
-            if variance != 0:
-                m_slope[idx] = covariance/variance
-                b_intercept[idx] = y_mean - m_slope[idx]*x_mean
-            else:
-                m_slope[idx] = 0
-                b_intercept[idx] = y_mean if axis == 0 else x_mean
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The slope and rounded intercept of each row or column.
+        """
+        grid_info = self.info(include_metadata=False)
+
+        # Group the objects once instead of filtering the table for every row/column
+        has_group = grid_info.loc[:, x_group].notna().to_numpy()
+        group = grid_info.loc[has_group, x_group].astype(int).to_numpy()
+        x = grid_info.loc[has_group, x_val].to_numpy(dtype=float)
+        y = grid_info.loc[has_group, y_val].to_numpy(dtype=float)
+
+        # Use 2D covariance/variance method for finding linear regression, for all nrows or columns at once
+        count = np.bincount(group, minlength=num_vectors)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x_mean = np.bincount(group, weights=x, minlength=num_vectors)/count
+            y_mean = np.bincount(group, weights=y, minlength=num_vectors)/count
+        x_dev, y_dev = x - x_mean[group], y - y_mean[group]
+        covariance = np.bincount(group, weights=x_dev*y_dev, minlength=num_vectors)
+        variance = np.bincount(group, weights=x_dev ** 2, minlength=num_vectors)
+
+        # Flat or empty rows/columns have no slope
+        has_variance = variance != 0
+        m_slope = np.zeros(shape=num_vectors)
+        m_slope[has_variance] = covariance[has_variance]/variance[has_variance]
+        b_intercept = np.where(has_variance, y_mean - m_slope*x_mean, y_mean if axis == 0 else x_mean)
 
         return m_slope, np.round(b_intercept)
 
@@ -368,7 +416,9 @@ class GridAccessor(ImageAccessorBase):
             column_3_data = grid_image.gray[:, col_3_min:col_3_max]
             ```
         """
-        return self._root_image.grid_finder.get_col_edges(self._root_image)
+        return self._cached(
+                'col_edges', lambda: self._root_image.grid_finder.get_col_edges(self._root_image),
+        ).copy()
 
     def get_col_map(self) -> np.ndarray:
         """Get an object map with objects labeled by their grid column number.
@@ -396,17 +446,7 @@ class GridAccessor(ImageAccessorBase):
                 print(f"Column {col_num}: {col_pixels} pixels")
             ```
         """
-        grid_info = self.info()
-        col_map = self._root_image.objmap[:].copy()
-        for n, col_bidx in enumerate(np.sort(grid_info.loc[:, str(GRID.COL_NUM)].unique())):
-            subtable = grid_info.loc[grid_info.loc[:, str(GRID.COL_NUM)] == col_bidx, :]
-
-            # Edit the new map's objects to equal the column number
-            col_map[np.isin(
-                    element=self._root_image.objmap[:],
-                    test_elements=subtable[OBJECT.LABEL].to_numpy(),
-            )] = n + 1
-        return col_map
+        return self._get_relabeled_map(str(GRID.COL_NUM))
 
     def show_column_overlay(self, use_enhanced=False, show_gridlines=True, ax=None,
                             figsize=(9, 10)) -> Tuple[plt.Figure, plt.Axes]:
@@ -500,7 +540,9 @@ class GridAccessor(ImageAccessorBase):
             row_4_data = grid_image.gray[row_4_min:row_4_max, :]
             ```
         """
-        return self._root_image.grid_finder.get_row_edges(self._root_image)
+        return self._cached(
+                'row_edges', lambda: self._root_image.grid_finder.get_row_edges(self._root_image),
+        ).copy()
 
     def get_row_map(self) -> np.ndarray:
         """Get an object map with objects labeled by their grid row number.
@@ -528,19 +570,7 @@ class GridAccessor(ImageAccessorBase):
                 print(f"Row {row_num}: {row_pixels} pixels")
             ```
         """
-        grid_info = self.info()
-        row_map = self._root_image.objmap[:].copy()
-        for n, col_bidx in enumerate(np.sort(grid_info.loc[:, str(GRID.ROW_NUM)].unique())):
-            subtable = grid_info.loc[grid_info.loc[:, str(GRID.ROW_NUM)] == col_bidx, :]
-
-            # Edit the new map's objects to equal the column number
-            row_map[
-                np.isin(
-                        element=self._root_image.objmap[:],
-                        test_elements=subtable[OBJECT.LABEL].to_numpy(),
-                )
-            ] = n + 1
-        return row_map
+        return self._get_relabeled_map(str(GRID.ROW_NUM))
 
     def show_row_overlay(self, use_enhanced=False, show_gridlines=True, ax=None,
                          figsize=(9, 10)) -> (plt.Figure, plt.Axes):
@@ -647,17 +677,7 @@ class GridAccessor(ImageAccessorBase):
             plt.imshow(colored_sections)
             ```
         """
-        grid_info = self.info()
-
-        section_map = self._root_image.objmap[:]
-        for n, bidx in enumerate(np.sort(grid_info.loc[:, GRID.SECTION_NUM].unique())):
-            subtable = grid_info.loc[grid_info.loc[:, GRID.SECTION_NUM] == bidx, :]
-            section_map[np.isin(
-                    element=self._root_image.objmap[:],
-                    test_elements=subtable.loc[:, OBJECT.LABEL].to_numpy(),
-            )] = n + 1
-
-        return section_map
+        return self._get_relabeled_map(str(GRID.SECTION_NUM))
 
     def get_section_counts(self, ascending=False) -> pd.DataFrame:
         """Count the number of objects (colonies) in each grid section.
@@ -702,7 +722,10 @@ class GridAccessor(ImageAccessorBase):
             print(f"Array completeness: {completeness:.1f}%")
             ```
         """
-        return self.info().loc[:, GRID.SECTION_NUM].value_counts().sort_values(ascending=ascending)
+        # value_counts decides the order of sections with equal counts, which callers such as
+        # MinResidualErrorReducer rely on when picking the most crowded section
+        return (self.info(include_metadata=False).loc[:, str(GRID.SECTION_NUM)]
+                .value_counts().sort_values(ascending=ascending))
 
     def get_info_by_section(self, section_number):
         """Get grid information for colonies in a specific grid section.
@@ -754,8 +777,10 @@ class GridAccessor(ImageAccessorBase):
             return grid_info.loc[grid_info.loc[:, str(GRID.SECTION_NUM)] == section_number, :]
         elif isinstance(section_number, tuple) and len(section_number) == 2:  # Access by row and col number
             grid_info = self.info()
-            grid_info = grid_info.loc[grid_info.loc[:, str(GRID.ROW_NUM)] == section_number[0], :]
-            return grid_info.loc[grid_info.loc[:, str(GRID.ROW_NUM)] == section_number[1], :]
+            row_num, col_num = section_number
+            in_section = (grid_info.loc[:, str(GRID.ROW_NUM)].to_numpy() == row_num) \
+                         & (grid_info.loc[:, str(GRID.COL_NUM)].to_numpy() == col_num)
+            return grid_info.loc[in_section, :]
         else:
             raise ValueError('Section index should be int or a tuple of label_subset')
 
@@ -774,7 +799,7 @@ class GridAccessor(ImageAccessorBase):
                 giving pixel coordinates for slicing the parent image.
         """
         row_edges, col_edges = self.get_row_edges(), self.get_col_edges()
-        row_pos, col_pos = np.where(self._idx_ref_matrix == idx)
+        row_pos, col_pos = divmod(int(idx), self.ncols)
         min_cc = col_edges[col_pos]
         max_cc = col_edges[col_pos + 1]
         min_rr = row_edges[row_pos]
@@ -820,6 +845,45 @@ class GridAccessor(ImageAccessorBase):
 
         return (min_rr, min_cc), (max_rr, max_cc)
 
+    def _get_relabeled_map(self, column: str) -> np.ndarray:
+        """Internal method: relabel each object by the rank of its value in a grid info column.
+
+        The distinct values of the column are numbered from 1 in ascending order, and objects
+        without a value keep their original label. The whole map is relabeled in one lookup
+        table pass instead of one object map scan per value.
+
+        Args:
+            column (str): The grid info column to relabel by.
+
+        Returns:
+            np.ndarray: The relabeled object map.
+        """
+        objmap = self._root_image.objmap[:]
+        lut = self._cached('relabel_luts', lambda: self._get_relabel_luts(int(objmap.max()), objmap.dtype))
+        return lut[self._RELABEL_COLUMNS.index(column)][objmap]
+
+    def _get_relabel_luts(self, max_label: int, dtype) -> np.ndarray:
+        """Internal method: build the relabeling lookup tables for the row, column, and section maps.
+
+        Args:
+            max_label (int): The largest label in the object map.
+            dtype (np.dtype): The dtype of the object map.
+
+        Returns:
+            np.ndarray: Array of shape (3, max_label + 1) with one lookup table per column of
+                ``_RELABEL_COLUMNS``.
+        """
+        grid_info = self.info(include_metadata=False)
+        labels = grid_info.loc[:, OBJECT.LABEL].to_numpy(dtype=np.intp)
+
+        luts = np.tile(np.arange(max_label + 1, dtype=dtype), (len(self._RELABEL_COLUMNS), 1))
+        for lut, column in zip(luts, self._RELABEL_COLUMNS):
+            values = grid_info.loc[:, column]
+            has_value = values.notna().to_numpy()
+            values = values[has_value].astype(int).to_numpy()
+            lut[labels[has_value]] = np.searchsorted(np.unique(values), values) + 1
+        return luts
+
     def _get_section_labels(self, idx) -> list[int]:
         """Internal method: get object labels belonging to a grid section.
 
@@ -831,4 +895,4 @@ class GridAccessor(ImageAccessorBase):
         """
         grid_info = self.info()
         section_info = grid_info.loc[grid_info.loc[:, str(GRID.SECTION_NUM)] == idx, :]
-        return section_info.index.to_list()
+        return section_info.loc[:, OBJECT.LABEL].to_list()
@@ -8,11 +8,12 @@ from typing import TYPE_CHECKING, Tuple, Optional
 
 if TYPE_CHECKING: from phenotypic import Image
 
+import cv2
 import numpy as np
 import tifffile
 from matplotlib import pyplot as plt
-from skimage.color import rgb2hsv
 from skimage.exposure import histogram
+from skimage.util import img_as_float32
 import skimage.io
 
 import phenotypic
@@ -108,12 +109,42 @@ class HsvAccessor(ImageAccessorBase):
 
         return arr
 
+    @staticmethod
+    def _rgb2hsv(rgb: np.ndarray) -> np.ndarray:
+        """Convert an RGB array to float32 HSV with every channel in [0, 1].
+
+        Matches skimage.color.rgb2hsv to float32 precision, but uses OpenCV's single pass
+        conversion, which is over an order of magnitude faster. OpenCV offsets the saturation
+        denominator by a float epsilon, so the saturation is recomputed exactly.
+
+        Args:
+            rgb (np.ndarray): RGB image array of shape (H, W, 3).
+
+        Returns:
+            np.ndarray: float32 HSV array of shape (H, W, 3).
+        """
+        rgb = img_as_float32(rgb)
+        hsv = cv2.cvtColor(rgb, cv2.COLOR_RGB2HSV_FULL)
+        hsv[..., 0] *= np.float32(1/360)
+
+        val = hsv[..., 2]
+        delta = np.minimum(rgb[..., 0], rgb[..., 1])
+        np.minimum(delta, rgb[..., 2], out=delta)
+        np.subtract(val, delta, out=delta)
+        np.divide(delta, val, out=hsv[..., 1], where=val > 0)
+        return hsv
+
     @property
     def _subject_arr(self) -> np.ndarray:
         if self._root_image.rgb.isempty():
             raise AttributeError('HSV is not available for grayscale images')
-        else:
-            return rgb2hsv(self._root_image.rgb[:])
+
+        # The conversion is cached on the image data since measurements read it repeatedly
+        data = self._root_image._data
+        if data.hsv is None:
+            data.hsv = self._rgb2hsv(data.rgb)
+            data.hsv.flags.writeable = False
+        return data.hsv
 
     def __getitem__(self, key) -> np.ndarray:
         view = self._subject_arr[key]
@@ -87,6 +87,10 @@ class ObjectsAccessor:
         """
         self._root_image = root_image
 
+        # Object info only depends on the object map, which is replaced rather than modified
+        self._info_cache = None
+        self._info_cache_src = None
+
     def __len__(self) -> int:
         """Return the number of detected colonies in the plate image.
 
@@ -182,8 +186,9 @@ class ObjectsAccessor:
             ]
             ```
         """
-        for i in range(self._root_image.num_objects):
-            yield self[i]
+        # Compute the regions once rather than once per colony
+        for region in self.props:
+            yield self._crop_region(region)
 
     def __getitem__(self, index: int) -> Image:
         """Extract a specific colony by its position index.
@@ -245,11 +250,13 @@ class ObjectsAccessor:
                     colony.show()
             ```
         """
-        current_object = self.props[index]
-        label = current_object.label
-        object_image = self._root_image[current_object.slice]
+        return self._crop_region(self.props[index])
+
+    def _crop_region(self, region) -> Image:
+        """Crop the root image to a region's bounding box, keeping only that region's object."""
+        object_image = self._root_image[region.slice]
         object_image.metadata[METADATA.IMAGE_TYPE] = IMAGE_TYPES.OBJECT.value
-        object_image.objmap[object_image.objmap[:] != label] = 0
+        object_image.objmap[object_image.objmap[:] != region.label] = 0
         return object_image
 
     @property
@@ -809,21 +816,27 @@ class ObjectsAccessor:
             print(f"Average colony height: {info['BBox_Height'].mean():.1f} pixels")
             ```
         """
-        info = pd.DataFrame(
-                data=regionprops_table(
-                        label_image=self._root_image.objmap[:],
-                        properties=['label', 'centroid', 'bbox'],
-                ),
-        ).rename(columns={
-            'label'     : OBJECT.LABEL,
-            'centroid-0': str(BBOX.CENTER_RR),
-            'centroid-1': str(BBOX.CENTER_CC),
-            'bbox-0'    : str(BBOX.MIN_RR),
-            'bbox-1'    : str(BBOX.MIN_CC),
-            'bbox-2'    : str(BBOX.MAX_RR),
-            'bbox-3'    : str(BBOX.MAX_CC),
-        },
-        )
+        objmap_src = self._root_image._data.sparse_object_map
+        if self._info_cache_src is not objmap_src:
+            self._info_cache = pd.DataFrame(
+                    data=regionprops_table(
+                            label_image=self._root_image.objmap[:],
+                            properties=['label', 'centroid', 'bbox'],
+                    ),
+            ).rename(columns={
+                'label'     : OBJECT.LABEL,
+                'centroid-0': str(BBOX.CENTER_RR),
+                'centroid-1': str(BBOX.CENTER_CC),
+                'bbox-0'    : str(BBOX.MIN_RR),
+                'bbox-1'    : str(BBOX.MIN_CC),
+                'bbox-2'    : str(BBOX.MAX_RR),
+                'bbox-3'    : str(BBOX.MAX_CC),
+            },
+            )
+            self._info_cache_src = objmap_src
+
+        # Hand out a copy so callers can add columns without touching the cache
+        info = self._info_cache.copy()
         if include_metadata:
             return self._root_image.metadata.insert_metadata(info)
         else:
@@ -5,7 +5,7 @@ if TYPE_CHECKING: pass
 
 import numpy as np
 
-from scipy.sparse import csc_matrix, coo_matrix
+from scipy.sparse import csc_matrix, csr_matrix, coo_matrix
 import matplotlib.pyplot as plt
 from skimage.measure import label
 
@@ -25,6 +25,17 @@ class ObjectMap(SingleChannelAccessor):
 
     """
 
+    def __init__(self, root_image):
+        super().__init__(root_image)
+        self._dense_cache = None
+        self._dense_cache_src = None
+
+    def __getstate__(self):
+        # The dense cache is rebuilt on demand, so keep it out of pickles
+        state = self.__dict__.copy()
+        state['_dense_cache'] = state['_dense_cache_src'] = None
+        return state
+
     @property
     def _backend(self):
         """Returns the current sparse backend reference.
@@ -34,6 +45,19 @@ class ObjectMap(SingleChannelAccessor):
         """
         return self._root_image._data.sparse_object_map
 
+    def _dense(self) -> np.ndarray:
+        """Returns a read-only dense view of the object map.
+
+        The sparse backend is replaced rather than modified, so the densified map stays valid
+        until the backend changes. This lets repeated reads share a single conversion.
+        """
+        backend = self._backend
+        if self._dense_cache_src is not backend:
+            dense = backend.toarray()
+            dense.flags.writeable = False
+            self._dense_cache, self._dense_cache_src = dense, backend
+        return self._dense_cache
+
     @property
     def _num_objects(self):
         return len(self._labels)
@@ -41,8 +65,8 @@ class ObjectMap(SingleChannelAccessor):
     @property
     def _labels(self):
         """Returns the labels in the image."""
-        objmap = self._backend.toarray()
-        labels = np.unique(objmap)
+        # The sparse backend only stores object pixels, so there is no background to sort through
+        labels = np.unique(self._backend.data)
         return labels[labels != 0]
 
     def __array__(self, dtype=None, copy=None):
@@ -58,12 +82,10 @@ class ObjectMap(SingleChannelAccessor):
         Returns:
             Dense numpy array representation of the object map
         """
-        arr = self._backend.toarray()
+        arr = self._dense()
         if dtype is not None:
-            arr = arr.astype(dtype, copy=False if copy is None else copy)
-        elif copy:
-            arr = arr.copy()
-        return arr
+            return arr.astype(dtype)
+        return arr.copy()
 
     def __getitem__(self, key):
         """Returns a slice of the object_map as if it were a dense array.
@@ -71,7 +93,11 @@ class ObjectMap(SingleChannelAccessor):
         The slicing behavior matches numpy arrays, converting the sparse
         representation to dense for the operation.
         """
-        return self._backend.toarray()[key]
+        section = self._dense()[key]
+        # Views would expose the cached map, so hand back a copy the caller owns
+        if isinstance(section, np.ndarray) and section.base is not None:
+            section = section.copy()
+        return section
 
     def __setitem__(self, key, value):
         """Sets values in the object map as if it were a dense array.
@@ -79,8 +105,15 @@ class ObjectMap(SingleChannelAccessor):
         Converts to dense, applies the update, then converts back to sparse.
         The operation is atomic with respect to the backend reference.
         """
+        # Replacing the whole map does not need the current labels, so skip the dense round trip
+        if isinstance(value, np.ndarray) and (key is Ellipsis or (isinstance(key, slice) and key == slice(None))):
+            if value.shape != self.shape:
+                raise ArrayKeyValueShapeMismatchError
+            self._root_image._data.sparse_object_map = self._dense_to_sparse(value)
+            return
+
         # Get current backend and convert to dense once
-        dense = self._backend.toarray()
+        dense = self._dense().copy()
         backend_dtype = self._backend.dtype
 
         if isinstance(value, np.ndarray):  # Array case
@@ -101,14 +134,44 @@ class ObjectMap(SingleChannelAccessor):
         # if 0 not in dense:
         #     dense = clear_border(dense, buffer_size=0, bgval=1)
 
-        # Update backend atomically
-        new_sparse = self._dense_to_sparse(dense)
-        new_sparse.eliminate_zeros()  # Remove zero values to save space
+        # Update backend atomically. Writes confined to a band of rows only need those rows re-encoded
+        rows = self._written_rows(key)
+        if rows is None:
+            new_sparse = self._dense_to_sparse(dense)
+        else:
+            new_sparse = self._splice_rows(self._backend, dense, *rows)
         self._root_image._data.sparse_object_map = new_sparse
 
+        # The updated dense array already matches the new backend, so keep it for the next read
+        dense.flags.writeable = False
+        self._dense_cache, self._dense_cache_src = dense, new_sparse
+
+    def _written_rows(self, key) -> tuple[int, int] | None:
+        """Returns the (start, stop) rows a write with this key can touch, or None if unknown."""
+        row_key = key[0] if isinstance(key, tuple) and len(key) > 0 else key
+        if isinstance(row_key, slice) and row_key.step in (None, 1):
+            start, stop, _ = row_key.indices(self.shape[0])
+            if start < stop:
+                return start, stop
+        return None
+
+    @classmethod
+    def _splice_rows(cls, sparse: csr_matrix, dense: np.ndarray, start: int, stop: int) -> csr_matrix:
+        """Rebuilds a CSR matrix by re-encoding rows start:stop of the dense map and keeping the rest."""
+        band = cls._dense_to_sparse(dense[start:stop])
+        lo, hi = sparse.indptr[start], sparse.indptr[stop]
+        data = np.concatenate([sparse.data[:lo], band.data, sparse.data[hi:]])
+        indices = np.concatenate([sparse.indices[:lo], band.indices, sparse.indices[hi:]])
+        indptr = np.concatenate([
+            sparse.indptr[:start],
+            band.indptr + lo,
+            sparse.indptr[stop + 1:] - hi + lo + band.nnz,
+        ])
+        return csr_matrix((data, indices, indptr), shape=dense.shape)
+
     @property
     def _subject_arr(self) -> np.ndarray:
-        return self._backend.toarray()
+        return self._dense()
 
     @property
     def shape(self) -> tuple[int, int]:
@@ -116,10 +179,18 @@ class ObjectMap(SingleChannelAccessor):
 
     def copy(self) -> np.ndarray:
         """Returns a copy of the object_map."""
-        return self._backend.toarray().copy()
+        return self._dense().copy()
+
+    def as_csr(self) -> csr_matrix:
+        """Returns a copy of the object map as a compressed sparse row matrix"""
+        return self._backend.copy()
 
     def as_csc(self) -> csc_matrix:
-        """Returns a copy of the object map as a compressed sparse column matrix"""
+        """Returns a copy of the object map as a compressed sparse column matrix
+
+        Note:
+            - The backend is stored row-major, so this conversion is done on request.
+        """
         return self._backend.tocsc()
 
     def as_coo(self) -> coo_matrix:
@@ -152,7 +223,7 @@ class ObjectMap(SingleChannelAccessor):
             tuple: A tuple containing the matplotlib Figure and Axes objects, where the
                 sparse object map is rendered.
         """
-        return self._plot(arr=self._backend.toarray(),
+        return self._plot(arr=self._dense(),
                           figsize=figsize, title=title, ax=ax, cmap=cmap, mpl_settings=mpl_params,
                           )
 
@@ -171,12 +242,12 @@ class ObjectMap(SingleChannelAccessor):
                          as a neighbor. Accepted values are 1 or 2 for 2D.
         """
         # Get the current mask and relabel it
-        mask = self._backend.toarray() > 0
+        mask = self._dense() > 0
         relabeled = label(mask, connectivity=connectivity)
         self._root_image._data.sparse_object_map = self._dense_to_sparse(relabeled)
 
     @staticmethod
-    def _dense_to_sparse(arg) -> csc_matrix:
+    def _dense_to_sparse(arg) -> csr_matrix:
         """Constructs a sparse array from the arg parameter. Used so that the underlying sparse matrix can be changed
 
         Args:
@@ -185,6 +256,14 @@ class ObjectMap(SingleChannelAccessor):
         Returns:
 
         """
-        sparse = csc_matrix(arg, dtype=np.uint16)
-        sparse.eliminate_zeros()
-        return sparse
+        if isinstance(arg, tuple):
+            return csr_matrix(arg, dtype=np.uint16)
+
+        # Build the CSR arrays straight from the nonzero positions. Row-major order already
+        # sorts them by row, so this skips the intermediate COO matrix and its conversion,
+        # and no explicit zeros are ever stored.
+        dense = np.asarray(arg).astype(np.uint16, copy=False)
+        flat_idx = np.flatnonzero(dense)
+        rows, cols = np.divmod(flat_idx, dense.shape[1])
+        indptr = np.searchsorted(rows, np.arange(dense.shape[0] + 1))
+        return csr_matrix((dense.ravel()[flat_idx], cols, indptr), shape=dense.shape)
@@ -44,7 +44,7 @@ class ObjectMask(SingleChannelAccessor):
         Returns:
             Dense binary numpy array (0s and 1s) representation of the object mask
         """
-        arr = (self._backend.toarray() > 0).astype(int)
+        arr = (self._root_image.objmap._dense() > 0).astype(int)
         if dtype is not None:
             arr = arr.astype(dtype, copy=False if copy is None else copy)
         elif copy:
@@ -57,7 +57,7 @@ class ObjectMask(SingleChannelAccessor):
         The slicing behavior matches numpy arrays, converting the sparse
         representation to dense and then to binary (0s and 1s).
         """
-        return (self._backend.toarray()[key] > 0).astype(int)
+        return (self._root_image.objmap._dense()[key] > 0).astype(int)
 
     def __setitem__(self, key, value: np.ndarray):
         """Sets values of the object mask as if it were a dense array.
@@ -71,7 +71,7 @@ class ObjectMask(SingleChannelAccessor):
             value: Binary value(s) to set (int, bool, or ndarray)
         """
         # Get current mask as dense array (convert once)
-        mask = self._backend.toarray() > 0
+        mask = self._root_image.objmap._dense() > 0
 
         # Apply the value based on type
         if isinstance(value, (int, bool)):
@@ -94,7 +94,6 @@ class ObjectMask(SingleChannelAccessor):
         # This is where the relabeling occurs to maintain consistent object IDs
         relabeled = label(mask)
         new_sparse = self._root_image.objmap._dense_to_sparse(relabeled)
-        new_sparse.eliminate_zeros()
         self._root_image._data.sparse_object_map = new_sparse
 
     @property
@@ -112,7 +111,7 @@ class ObjectMask(SingleChannelAccessor):
 
     def copy(self) -> np.ndarray:
         """Returns a copy of the binary object mask"""
-        return (self._backend.toarray() > 0).astype(int).copy()
+        return (self._root_image.objmap._dense() > 0).astype(int)
 
     def reset(self):
         """
@@ -145,7 +144,7 @@ class ObjectMask(SingleChannelAccessor):
 
     def _create_foreground(self, array: np.ndarray, bg_label: int = 0) -> np.ndarray:
         """Returns a copy of the array with every non-object pixel set to 0. Equivalent to np.ma.array.filled(bg_label)"""
-        mask = self._backend.toarray() > 0
+        mask = self._root_image.objmap._dense() > 0
         if array.ndim == 3:
             mask = np.dstack([mask for _ in range(array.shape[-1])])
 
@@ -154,4 +153,4 @@ class ObjectMask(SingleChannelAccessor):
 
     @property
     def _subject_arr(self) -> np.ndarray:
-        return (self._backend.toarray() > 0).astype(int)
+        return (self._root_image.objmap._dense() > 0).astype(int)
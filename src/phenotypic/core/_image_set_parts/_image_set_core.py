@@ -141,12 +141,14 @@ class ImageSetCore:
         filepaths = [dirpath/x for x in os.listdir(dirpath)
                      if x.endswith(IO.ACCEPTED_FILE_EXTENSIONS + IO.RAW_FILE_EXTENSIONS)]
         filepaths.sort()
+        # Decode one file per CPU at a time, so reads overlap without holding the whole directory in memory
+        batch_size = os.cpu_count() or 1
         with self.hdf_.safe_writer() as writer:
             data_group = self.hdf_.get_data_group(writer)
             template = self._get_template()
-            for fpath in filepaths:
-                image = template.imread(fpath, **self.imparams)
-                image._save_image2hdfgroup(grp=data_group, compression="gzip", compression_opts=4)
+            for start in range(0, len(filepaths), batch_size):
+                for image in template.imread_many(filepaths[start:start + batch_size], **self.imparams):
+                    image._save_image2hdfgroup(grp=data_group, compression="gzip", compression_opts=4)
 
         return
 
@@ -4,8 +4,6 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING: from phenotypic import GridImage
 
 import numpy as np
-from scipy.spatial.distance import euclidean
-from scipy.optimize import minimize_scalar
 
 from phenotypic.abc_ import GridCorrector
 from phenotypic.tools.constants_ import OBJECT, BBOX, GRID
@@ -19,6 +17,9 @@ class GridAligner(GridCorrector):
 
     """
 
+    # Angles in degrees below which the image is left as is
+    _MIN_ROTATION_ANGLE = 1e-3
+
     def __init__(self, axis: int = 0, mode: str = 'edge'):
         self.axis = axis
         self.mode = mode
@@ -53,58 +54,54 @@ class GridAligner(GridCorrector):
 
         # Find the slope info along the axis
         m, b = image.grid.get_centroid_alignment_info(axis=self.axis)
-        grid_info = image.grid.info()
+        grid_info = image.grid.info(include_metadata=False)
+
+        # Sort the objects by row/column once, so the vertex and ray x positions of every group
+        # come from one min and one max reduction over contiguous runs
+        has_group = grid_info.loc[:, x_group].notna().to_numpy()
+        group = grid_info.loc[has_group, x_group].astype(int).to_numpy()
+        x = grid_info.loc[has_group, x_val].to_numpy(dtype=float)
+        order = np.argsort(group, kind='stable')
+        group, x = group[order], x[order]
+        starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+
+        # Only rows/columns with objects have vertices
+        group = group[starts]
+        m, b = m[group], b[group]
 
         # Collect the X position of the vertices
-        x_min = grid_info.groupby(x_group, observed=True)[x_val].min().to_numpy()
+        x_min = np.minimum.reduceat(x, starts)
 
         y_0 = (x_min*m) + b  # Find the corresponding y-other_image at the above x values
 
         # Find the x other_image of the upper ray
-        x_max = grid_info.groupby(x_group, observed=True)[x_val].max().to_numpy()
+        x_max = np.maximum.reduceat(x, starts)
 
         y_1 = (x_max*m) + b  # Find the corresponding y-other_image at the above x values
 
-        # Collect opening angle ray coordinate info
-        xy_vertices = np.vstack([x_min, y_0]).T  # An array containing the x & y coordinates of the vertices
-
-        xy_upper_ray = np.vstack([x_max, y_1]).T  # An array containing the x & y coordinates of the upper ray endpoint
-
-        # Function to find the euclidead distance between two points within two xy arrays stacked column-wise
-
-        # Get the size of each hypotenuse
-        hyp_dist = np.apply_along_axis(func1d=self._find_hyp_dist, axis=1,
-                                       arr=np.column_stack([xy_vertices, xy_upper_ray]))
-
+        # Get the size of each hypotenuse between the vertex and the upper ray endpoint
         adj_dist = x_max - x_min
+        hyp_dist = np.hypot(adj_dist, y_1 - y_0)
 
-        adj_over_hyp = np.divide(adj_dist, hyp_dist, where=(hyp_dist != 0) | (adj_dist != 0))
+        adj_over_hyp = np.divide(adj_dist, hyp_dist, out=np.ones_like(hyp_dist), where=hyp_dist != 0)
 
         # Find the angle of rotation from horizon in degrees
         theta = np.arccos(adj_over_hyp)*(180.0/np.pi)
 
         # Adds the correct orientation to the angle
         theta_sign = y_0 - y_1
-        theta = theta*(np.divide(theta_sign, abs(theta_sign), where=theta_sign != 0))
+        theta = theta*np.sign(theta_sign)
 
-        def find_angle_of_rot(x):
-            new_theta = theta + x
-            err = np.mean(new_theta ** 2)
-            return err
+        # The mean squared angle after rotating by x is minimized where x cancels the mean angle
+        optimal_angle = -float(np.mean(theta))
 
-        largest_angle = np.abs(theta).max()
-        optimal_angle = minimize_scalar(
-                fun=find_angle_of_rot,
-                bounds=(-largest_angle, largest_angle),
-        )
+        # Rotations this small do not move any pixel by more than a fraction of its width
+        if abs(optimal_angle) < self._MIN_ROTATION_ANGLE:
+            return image
 
-        image.rotate(angle_of_rotation=optimal_angle.x, mode=self.mode)
+        image.rotate(angle_of_rotation=optimal_angle, mode=self.mode)
         return image
 
-    @staticmethod
-    def _find_hyp_dist(row):
-        return euclidean(u=[row[0], row[1]], v=[row[2], row[3]])
-
 
 # Set the documentation to match for sphinx. This is unavoidable due to sphinx statically resolving.
 GridAligner.apply.__doc__ = GridAligner._operate.__doc__
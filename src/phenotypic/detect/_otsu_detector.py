@@ -45,7 +45,7 @@ class OtsuDetector(ThresholdDetector):
         """
         enh_matrix = image.enh_gray[:]
         nbins = 2 ** int(image.bit_depth)
-        mask = image.enh_gray[:] >= threshold_otsu(
+        mask = enh_matrix >= threshold_otsu(
                 enh_matrix[enh_matrix != 0] if self.ignore_zeros else enh_matrix, nbins=nbins
         )
         mask = clear_border(mask) if self.ignore_borders else mask
@@ -36,8 +36,9 @@ class TriangleDetector(ThresholdDetector):
         Returns:
             Image: The modified image object with an updated output mask (`omask`).
         """
+        enh_matrix = image.enh_gray[:]
         nbins = 2 ** image.bit_depth
-        image.objmask[:] = image.enh_gray[:] >= threshold_triangle(image.enh_gray[:], nbins=nbins)
+        image.objmask[:] = enh_matrix >= threshold_triangle(enh_matrix, nbins=nbins)
         return image
 
 
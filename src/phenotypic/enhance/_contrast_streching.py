@@ -61,6 +61,17 @@ class ContrastStretching(ImageEnhancer):
         self.upper_percentile = upper_percentile
 
     def _operate(self, image: Image) -> Image:
-        p_lower, p_upper = np.percentile(image.enh_gray[:], (self.lower_percentile, self.upper_percentile))
-        image.enh_gray[:] = rescale_intensity(image=image.enh_gray[:], in_range=(p_lower, p_upper))
+        enh_gray = image.enh_gray[:]
+        p_lower, p_upper = map(float, np.percentile(enh_gray, (self.lower_percentile, self.upper_percentile)))
+        if np.issubdtype(enh_gray.dtype, np.floating) and p_lower != p_upper:
+            # Same arithmetic as rescale_intensity onto the float range, done in place on the clipped copy
+            out_lower = 0.0 if p_lower >= 0 else -1.0
+            stretched = np.clip(enh_gray, p_lower, p_upper)
+            stretched -= p_lower
+            stretched /= p_upper - p_lower
+            stretched *= 1.0 - out_lower
+            stretched += out_lower
+            image.enh_gray[:] = stretched
+        else:
+            image.enh_gray[:] = rescale_intensity(image=enh_gray, in_range=(p_lower, p_upper))
         return image
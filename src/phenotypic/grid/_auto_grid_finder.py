@@ -74,64 +74,51 @@ class AutoGridFinder(GridFinder):
         # Use base class helper to assemble complete grid info
         return super()._get_grid_info(image=image, row_edges=row_edges, col_edges=col_edges)
 
-    def _find_padding_midpoint_error(self, pad_sz, image, axis, row_pad=0, col_pad=0) -> float:
+    def _find_padding_midpoint_error(self, pad_sz, image, axis, info_table: pd.DataFrame) -> float:
         """
         Calculate the mean squared error between object midpoints and grid bin midpoints.
-        
+
+        Only the bins along the optimized axis affect the error, so the other axis is not gridded.
+
         Args:
             pad_sz: Padding size to test for the specified axis.
             image: Image object containing objects to be gridded.
             axis: 0 for rows, 1 for columns.
-            row_pad: Current row padding (used when optimizing columns).
-            col_pad: Current column padding (used when optimizing rows).
-            
+            info_table: Object information of the image. It does not depend on the padding, so the
+                solver measures it once and reuses it for every evaluation.
+
         Returns:
             float: Mean squared error between object and bin midpoints.
         """
-        obj_info = image.objects.info(include_metadata=False)
-
         if axis == 0:
-            # Calculate row edges with current padding
-            row_edges = self._get_row_edges(image=image, row_padding=pad_sz, info_table=obj_info)
-            col_edges = self._get_col_edges(image=image, column_padding=col_pad, info_table=obj_info)
-
-            # Get grid info with these edges
-            current_grid_info = super()._get_grid_info(image=image, row_edges=row_edges, col_edges=col_edges)
-            current_obj_midpoints = (current_grid_info.loc[:, [str(BBOX.CENTER_RR), str(GRID.ROW_NUM)]]
-                                     .groupby(str(GRID.ROW_NUM), observed=False)[str(BBOX.CENTER_RR)]
-                                     .mean().values)
-
-            bin_edges = np.histogram_bin_edges(
-                    a=current_grid_info.loc[:, str(BBOX.CENTER_RR)].values,
-                    bins=self.nrows,
-                    range=(
-                        current_grid_info.loc[:, str(BBOX.MIN_RR)].min() - pad_sz,
-                        current_grid_info.loc[:, str(BBOX.MAX_RR)].max() + pad_sz
-                    ),
-            )
+            center_col, bin_col, nbins = str(BBOX.CENTER_RR), str(GRID.ROW_NUM), self.nrows
+            lower, upper = info_table.loc[:, str(BBOX.MIN_RR)].min(), info_table.loc[:, str(BBOX.MAX_RR)].max()
+
+            # Assign each object to a row using the edges for this padding
+            row_edges = self._get_row_edges(image=image, row_padding=pad_sz, info_table=info_table)
+            current_grid_info = self._add_row_number_info(table=info_table.loc[:, [center_col]],
+                                                          row_edges=row_edges, imshape=image.shape)
 
         elif axis == 1:
-            # Calculate column edges with current padding
-            row_edges = self._get_row_edges(image=image, row_padding=row_pad, info_table=obj_info)
-            col_edges = self._get_col_edges(image=image, column_padding=pad_sz, info_table=obj_info)
-
-            # Get grid info with these edges
-            current_grid_info = super()._get_grid_info(image=image, row_edges=row_edges, col_edges=col_edges)
-            current_obj_midpoints = (current_grid_info.loc[:, [str(BBOX.CENTER_CC), str(GRID.COL_NUM)]]
-                                     .groupby(str(GRID.COL_NUM), observed=False)[str(BBOX.CENTER_CC)]
-                                     .mean().values)
-
-            bin_edges = np.histogram_bin_edges(
-                    a=current_grid_info.loc[:, str(BBOX.CENTER_CC)].values,
-                    bins=self.ncols,
-                    range=(
-                        current_grid_info.loc[:, str(BBOX.MIN_CC)].min() - pad_sz,
-                        current_grid_info.loc[:, str(BBOX.MAX_CC)].max() + pad_sz
-                    ),
-            )
+            center_col, bin_col, nbins = str(BBOX.CENTER_CC), str(GRID.COL_NUM), self.ncols
+            lower, upper = info_table.loc[:, str(BBOX.MIN_CC)].min(), info_table.loc[:, str(BBOX.MAX_CC)].max()
+
+            # Assign each object to a column using the edges for this padding
+            col_edges = self._get_col_edges(image=image, column_padding=pad_sz, info_table=info_table)
+            current_grid_info = self._add_col_number_info(table=info_table.loc[:, [center_col]],
+                                                          col_edges=col_edges, imshape=image.shape)
         else:
             raise ValueError(f"Invalid axis other_image: {axis}")
 
+        current_obj_midpoints = (current_grid_info
+                                 .groupby(bin_col, observed=False)[center_col]
+                                 .mean().values)
+
+        bin_edges = np.histogram_bin_edges(
+                a=current_grid_info.loc[:, center_col].values,
+                bins=nbins,
+                range=(lower - pad_sz, upper + pad_sz),
+        )
         bin_edges.sort()
 
         # (larger_point-smaller_point)/2 + smaller_point; Across all axis vectors
@@ -163,7 +150,7 @@ class AutoGridFinder(GridFinder):
         max_row_pad_size = min(min_rr - 1, abs(image.shape[0] - max_rr - 1))
         max_row_pad_size = 0 if max_row_pad_size < 0 else max_row_pad_size  # Clip in case pad size is negative
 
-        partial_row_pad_finder = partial(self._find_padding_midpoint_error, image=image, axis=0, row_pad=0, col_pad=0)
+        partial_row_pad_finder = partial(self._find_padding_midpoint_error, image=image, axis=0, info_table=obj_info)
         return int(self._apply_solver(partial_row_pad_finder, max_value=max_row_pad_size, min_value=0))
 
     def _get_row_edges(self, image: Image, row_padding: int, info_table: pd.DataFrame):
@@ -231,7 +218,7 @@ class AutoGridFinder(GridFinder):
         max_col_pad_size = min(min_cc - 1, abs(image.shape[1] - max_cc - 1))
         max_col_pad_size = 0 if max_col_pad_size < 0 else max_col_pad_size  # Clip in case pad size is negative
 
-        partial_col_pad_finder = partial(self._find_padding_midpoint_error, image=image, axis=1, row_pad=0, col_pad=0)
+        partial_col_pad_finder = partial(self._find_padding_midpoint_error, image=image, axis=1, info_table=obj_info)
         return self._apply_solver(partial_col_pad_finder, max_value=max_col_pad_size, min_value=0)
 
     def _get_col_edges(self, image: Image, column_padding: int, info_table: pd.DataFrame):
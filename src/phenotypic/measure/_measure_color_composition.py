@@ -140,7 +140,7 @@ class MeasureColorComposition(MeasureFeatures):
             pd.DataFrame: DataFrame with object labels and color composition percentages
         """
         # Get HSV representation (shape: H x W x 3)
-        # Note: skimage's rgb2hsv returns H in [0,1], S in [0,1], V in [0,1]
+        # Note: the HSV accessor returns H in [0,1], S in [0,1], V in [0,1]
         hsv_foreground = image.color.hsv.foreground()
 
         # Normalize to human-readable ranges: H: 0-360, S: 0-100, V: 0-100
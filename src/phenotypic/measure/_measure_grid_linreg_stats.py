@@ -4,8 +4,8 @@ from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING: from phenotypic import GridImage
 
+import numpy as np
 import pandas as pd
-from scipy.spatial.distance import euclidean
 
 from phenotypic.abc_ import GridMeasureFeatures
 from phenotypic.tools.constants_ import GRID_LINREG_STATS_EXTRACTOR, OBJECT, BBOX, GRID
@@ -81,12 +81,9 @@ class MeasureGridLinRegStats(GridMeasureFeatures):
         )
 
         # Calculate the distance each object is from it's predicted center. This is the residual error
-        section_info.loc[:, GRID_LINREG_STATS_EXTRACTOR.RESIDUAL_ERR] = section_info.apply(
-                lambda row: euclidean(
-                        u=[row[str(BBOX.CENTER_CC)], row[str(BBOX.CENTER_RR)]],
-                        v=[row[GRID_LINREG_STATS_EXTRACTOR.PRED_CC], row[GRID_LINREG_STATS_EXTRACTOR.PRED_RR]],
-                )
-                , axis=1
+        section_info.loc[:, GRID_LINREG_STATS_EXTRACTOR.RESIDUAL_ERR] = np.hypot(
+                section_info.loc[:, str(BBOX.CENTER_CC)] - section_info.loc[:, GRID_LINREG_STATS_EXTRACTOR.PRED_CC],
+                section_info.loc[:, str(BBOX.CENTER_RR)] - section_info.loc[:, GRID_LINREG_STATS_EXTRACTOR.PRED_RR],
         )
 
         return section_info.set_index(OBJECT.LABEL)
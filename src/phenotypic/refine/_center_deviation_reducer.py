@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING: from phenotypic import Image
 
-from scipy.spatial.distance import euclidean
+import numpy as np
 
 from phenotypic.abc_ import ObjectRefiner
 from phenotypic.tools.constants_ import OBJECT, BBOX
@@ -52,11 +52,9 @@ class CenterDeviationReducer(ObjectRefiner):
         bound_info = image.objects.info()
 
         # Add a column to the bound info for center deviation
-        bound_info.loc[:, 'Measurement_CenterDeviation'] = bound_info.apply(
-                lambda row: euclidean(u=[row[str(BBOX.CENTER_CC)], row[str(BBOX.CENTER_RR)]],
-                                      v=[img_center_cc, img_center_rr]
-                                      ),
-                axis=1
+        bound_info.loc[:, 'Measurement_CenterDeviation'] = np.hypot(
+                bound_info.loc[:, str(BBOX.CENTER_CC)] - img_center_cc,
+                bound_info.loc[:, str(BBOX.CENTER_RR)] - img_center_rr,
         )
 
         # Get the label of the obj w/ the least deviation
@@ -5,12 +5,12 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING: from phenotypic import Image
 
 import pandas as pd
-import numpy as np
 from skimage.measure import regionprops_table
 import math
 
 from ..abc_ import ObjectRefiner
 from ..tools.constants_ import OBJECT
+from ..tools.funcs_ import label_membership
 
 
 class LowCircularityRemover(ObjectRefiner):
@@ -78,7 +78,6 @@ class LowCircularityRemover(ObjectRefiner):
         table['circularity'] = (4*math.pi*table['area'])/(table['perimeter'] ** 2)
 
         passing_objects = table[table['circularity'] > self.cutoff]
-        failed_object_boolean_indices = ~(
-            np.isin(element=image.objmap[:], test_elements=passing_objects.index.to_numpy()))
+        failed_object_boolean_indices = ~label_membership(image.objmap[:], passing_objects.index.to_numpy())
         image.objmap[failed_object_boolean_indices] = 0
         return image
@@ -8,6 +8,7 @@ import numpy as np
 
 from phenotypic.abc_ import GridRefiner
 from phenotypic.tools.constants_ import BBOX, OBJECT
+from phenotypic.tools.funcs_ import label_membership
 
 
 class GridOversizedObjectRemover(GridRefiner):
@@ -64,26 +65,18 @@ class GridOversizedObjectRemover(GridRefiner):
         grid_info = image.grid.info()
 
         # To simplify calculation use the max width & distance
-        max_width = max(col_edges[1:] - col_edges[:-1])
-        max_height = max(row_edges[1:] - row_edges[:-1])
+        max_width = np.diff(col_edges).max()
+        max_height = np.diff(row_edges).max()
 
         # Calculate the width and height of each object
-        grid_info.loc[:, 'width'] = grid_info.loc[:, str(BBOX.MAX_CC)] \
-                                    - grid_info.loc[:, str(BBOX.MIN_CC)]
-
-        grid_info.loc[:, 'height'] = grid_info.loc[:, str(BBOX.MAX_RR)] \
-                                     - grid_info.loc[:, str(BBOX.MIN_RR)]
+        widths = (grid_info.loc[:, str(BBOX.MAX_CC)] - grid_info.loc[:, str(BBOX.MIN_CC)]).to_numpy()
+        heights = (grid_info.loc[:, str(BBOX.MAX_RR)] - grid_info.loc[:, str(BBOX.MIN_RR)]).to_numpy()
 
         # Find objects that are past the max height & width
-        over_width_obj = grid_info.loc[:, 'width'] >= max_width
-
-        over_height_obj = grid_info.loc[:, 'height'] >= max_height
-        oversized_obj_labels = grid_info.loc[
-            over_width_obj | over_height_obj,
-            OBJECT.LABEL
-        ].unique()
+        oversized = (widths >= max_width) | (heights >= max_height)
+        oversized_obj_labels = grid_info.loc[oversized, OBJECT.LABEL].unique()
 
         # Set the target objects to the background val of 0
-        image.objmap[np.isin(image.objmap[:], oversized_obj_labels)] = 0
+        image.objmap[label_membership(image.objmap[:], oversized_obj_labels)] = 0
 
         return image
@@ -72,9 +72,13 @@ class MaskFill(ObjectRefiner):
         self.origin = origin
 
     def _operate(self, image: Image) -> Image:
-        image.objmask[:] = binary_fill_holes(
-                input=image.objmask[:],
+        # Fill a boolean copy of the mask in place instead of allocating another result array
+        mask = image.objmap[:] > 0
+        binary_fill_holes(
+                input=mask,
                 structure=self.structure,
+                output=mask,
                 origin=self.origin
         )
+        image.objmask[:] = mask
         return image
@@ -3,11 +3,10 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING: from phenotypic import GridImage
 
-import numpy as np
-
 from phenotypic.abc_ import GridRefiner
 from phenotypic.measure import MeasureGridLinRegStats
 from phenotypic.tools.constants_ import GRID_LINREG_STATS_EXTRACTOR
+from phenotypic.tools.funcs_ import label_membership
 
 
 class MinResidualErrorReducer(GridRefiner):
@@ -81,7 +80,7 @@ class MinResidualErrorReducer(GridRefiner):
             objects_to_drop = section_info.index.drop(min_err_obj_id).to_numpy()
 
             # Set the objects with the labels to the background other_image
-            image.objmap[np.isin(obj_map, objects_to_drop)] = 0
+            image.objmap[label_membership(obj_map, objects_to_drop)] = 0
 
             # Reset section obj count and add counter
             section_obj_counts = image.grid.get_section_counts(ascending=False)
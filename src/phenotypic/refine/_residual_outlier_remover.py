@@ -3,12 +3,12 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING: from phenotypic import GridImage
 
-import numpy as np
 from typing import Optional
 
 from phenotypic.abc_ import GridRefiner
 from phenotypic.measure import MeasureGridLinRegStats
 from phenotypic.tools.constants_ import GRID_LINREG_STATS_EXTRACTOR, GRID
+from phenotypic.tools.funcs_ import label_membership
 
 
 class ResidualOutlierRemover(GridRefiner):
@@ -153,6 +153,6 @@ class ResidualOutlierRemover(GridRefiner):
                 outlier_obj_ids += col_err.loc[col_err >= upper_col_cutoff].index.tolist()
 
         # Remove objects from obj map
-        image.objmap[np.isin(image.objmap[:], outlier_obj_ids)] = 0
+        image.objmap[label_membership(image.objmap[:], outlier_obj_ids)] = 0
 
         return image
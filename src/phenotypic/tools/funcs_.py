@@ -21,6 +21,23 @@ def is_binary_mask(arr: np.ndarray):
     return True if (arr.ndim == 2 or arr.ndim == 3) and np.all((arr == 0) | (arr == 1)) else False
 
 
+def label_membership(label_map: np.ndarray, labels) -> np.ndarray:
+    """
+    Return a boolean mask of the pixels in *label_map* whose label is in *labels*.
+
+    Works like ``np.isin`` for non-negative integer label maps, but marks the labels in a
+    lookup table and gathers it with the map, so each pixel costs one index instead of a
+    binary search over *labels*.
+    """
+    label_map = np.asarray(label_map)
+    labels = np.asarray(labels, dtype=np.intp).ravel()
+    max_label = int(label_map.max()) if label_map.size > 0 else 0
+
+    lut = np.zeros(max_label + 1, dtype=bool)
+    lut[labels[(labels >= 0) & (labels <= max_label)]] = True
+    return lut[label_map]
+
+
 def timed_execution(func):
     """
     Decorator to measure and print the execution time of a function.
@@ -59,6 +76,35 @@ def murmur3_array_signature(arr: np.ndarray) -> bytes:
     return mmh3.mmh3_x64_128_digest(memoryview(arr))
 
 
+# Image components that are created on first access, mapped to the ImageData attribute holding them
+_LAZY_COMPONENTS = {'gray': '_gray', 'enh_gray': '_enh_gray'}
+
+
+def _is_unset_lazy_component(root, target: str) -> bool:
+    """Whether *target* names a lazily created image component that has not been created yet.
+
+    Reading such a component would create it, so the integrity checks skip it while it stays unset.
+    """
+    parts = target.split('.')
+    data = getattr(root, '_data', None)
+    if len(parts) != 2 or parts[1] not in _LAZY_COMPONENTS or data is None:
+        return False
+    if parts[1] == 'gray':
+        return data._gray is None and data.rgb is not None
+    return data._enh_gray is None and (data._gray is not None or data.rgb is not None)
+
+
+def _implicit_component_signature(root, target: str) -> bytes:
+    """Hash of the value an unset lazy component stood for, computed without storing it.
+
+    The gray of a color image is the luminance of its rgb, and the enhanced gray starts as the gray.
+    """
+    data = root._data
+    if target.split('.')[1] == 'enh_gray' and data._gray is not None:
+        return murmur3_array_signature(data._gray)
+    return murmur3_array_signature(root._rgb2gray(data.rgb))
+
+
 def validate_operation_integrity(*targets: str):
     """
     Decorator to ensure that key NumPy arrays on the 'image' argument
@@ -130,8 +176,10 @@ def validate_operation_integrity(*targets: str):
 
             # Step 4: Calculate hash values for all target arrays before function execution
             # This creates a dictionary mapping each target to its hash value
+            # Lazy components that were never created are recorded as None instead of being created here
             if VALIDATE_OPS:
-                pre_hashes = {tgt: murmur3_array_signature(_get_array(bound, tgt))
+                pre_hashes = {tgt: None if _is_unset_lazy_component(bound.arguments.get(tgt.split('.')[0]), tgt)
+                              else murmur3_array_signature(_get_array(bound, tgt))
                               for tgt in eff_targets
                               }
 
@@ -142,6 +190,11 @@ def validate_operation_integrity(*targets: str):
             # For each target, calculate a new hash and compare with the original
             if VALIDATE_OPS:
                 for tgt, old_hash in pre_hashes.items():
+                    if old_hash is None:
+                        # A component that is still unset is unchanged, otherwise it must match its implicit value
+                        if _is_unset_lazy_component(result, tgt):
+                            continue
+                        old_hash = _implicit_component_signature(result, tgt)
                     parts = tgt.split('.')
                     # Start with the result object returned by the function
                     obj = result
@@ -225,8 +278,10 @@ def validate_measure_integrity(*targets: str):
             bound.apply_defaults()
 
             # hash each target before the call
+            # lazy components that were never created are recorded as None instead of being created here
             if VALIDATE_OPS:
-                pre_hashes = {tgt: murmur3_array_signature(_get_array(bound, tgt))
+                pre_hashes = {tgt: None if _is_unset_lazy_component(bound.arguments.get(tgt.split('.')[0]), tgt)
+                              else murmur3_array_signature(_get_array(bound, tgt))
                               for tgt in eff_targets
                               }
 
@@ -236,6 +291,11 @@ def validate_measure_integrity(*targets: str):
             # re-hash and compare
             if VALIDATE_OPS:
                 for tgt, old in pre_hashes.items():
+                    if old is None:
+                        root = bound.arguments.get(tgt.split('.')[0])
+                        if _is_unset_lazy_component(root, tgt):
+                            continue
+                        old = _implicit_component_signature(root, tgt)
                     new = murmur3_array_signature(_get_array(bound, tgt))
                     if new != old:
                         raise OperationIntegrityError(opname=f'{func.__name__}', component=f'{tgt}')
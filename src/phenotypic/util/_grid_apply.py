@@ -22,20 +22,21 @@ class GridApply:
     def apply(self, image: GridImage):
         row_edges = image.grid.get_row_edges()
         col_edges = image.grid.get_col_edges()
-        for row_i in range(len(row_edges) - 1):
-            for col_i in range(len(col_edges) - 1):
-                subimage = image[
-                    row_edges[row_i]:row_edges[row_i + 1],
-                    col_edges[col_i]:col_edges[col_i + 1]
-                ]
+        row_slices = [slice(row_edges[i], row_edges[i + 1]) for i in range(len(row_edges) - 1)]
+        col_slices = [slice(col_edges[i], col_edges[i + 1]) for i in range(len(col_edges) - 1)]
+
+        # Collect the section masks locally so the objects are relabeled once instead of once per section
+        objmask = image.objmask[:] > 0
+        for row_i, row_slice in enumerate(row_slices):
+            for col_i, col_slice in enumerate(col_slices):
+                subimage = image[row_slice, col_slice]
                 try:
                     self.operation.apply(subimage, inplace=True)
                 except Exception as e:
                     raise RuntimeError(f"Error applying operation to section {row_i, col_i}: {e}")
 
-                image[
-                    row_edges[row_i]:row_edges[row_i + 1],
-                    col_edges[col_i]:col_edges[col_i + 1]
-                ] = subimage
+                image._set_pixel_data((row_slice, col_slice), subimage)
+                objmask[row_slice, col_slice] = subimage.objmask[:] > 0
 
+        image.objmask[:] = objmask
         return image
@@ -178,6 +178,33 @@ class TestHsvAccessor:
         hsv_arr = np.array(sample_rgb_image.color.hsv)
         assert hsv_arr.shape[-1] == 3  # Should have 3 channels
 
+    def test_hsv_cached_until_rgb_changes(self, sample_rgb_image):
+        """Test that HSV is converted once and recomputed after the rgb is written."""
+        first = sample_rgb_image.color.hsv[:]
+        assert np.shares_memory(first, sample_rgb_image.color.hsv[:])
+        sample_rgb_image.rgb[:10, :10] = 0
+        updated = sample_rgb_image.color.hsv[:]
+        assert not np.shares_memory(first, updated)
+        assert np.all(updated[:10, :10, 2] == 0)
+
+    def test_hsv_cache_shared_by_copy(self, sample_rgb_image):
+        """Test that a copy reuses the read-only HSV cache of its source."""
+        hsv = sample_rgb_image.color.hsv[:]
+        copied = sample_rgb_image.copy()
+        assert np.shares_memory(copied.color.hsv[:], hsv)
+        copied.rgb[:] = 0
+        assert not np.shares_memory(copied.color.hsv[:], hsv)
+        assert np.array_equal(sample_rgb_image.color.hsv[:], hsv)
+
+    def test_hsv_matches_skimage(self, sample_rgb_image):
+        """Test that the HSV conversion agrees with skimage.color.rgb2hsv."""
+        from skimage.color import rgb2hsv
+
+        expected = rgb2hsv(sample_rgb_image.rgb[:])
+        result = sample_rgb_image.color.hsv[:]
+        assert result.dtype == np.float32
+        assert np.allclose(result, expected, atol=1e-5)
+
 
 class TestColorSpaceAccessors:
     """Tests for color space accessors (XYZ, CIELAB, etc.)."""
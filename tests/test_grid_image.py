@@ -4,6 +4,8 @@ from phenotypic import Image, GridImage
 from phenotypic.grid import AutoGridFinder
 from phenotypic.detect import OtsuDetector
 from phenotypic.tools.exceptions_ import IllegalAssignmentError
+from phenotypic.tools.constants_ import GRID
+from phenotypic.data import load_plate_12hr
 
 from .resources.TestHelper import timeit
 
@@ -69,3 +71,91 @@ def test_optimal_grid_setter_defaults():
     assert isinstance(grid_setter, AutoGridFinder)
     assert grid_setter.nrows == 8
     assert grid_setter.ncols == 12
+
+
+@timeit
+def test_grid_info_cached_until_objects_change(plate_grid_images_with_detection):
+    grid_image = plate_grid_images_with_detection
+    info = grid_image.grid.info(include_metadata=False)
+    row_edges = grid_image.grid.get_row_edges()
+    assert grid_image.grid._cache_key is not None
+
+    info.iloc[:, 0] = -1
+    assert grid_image.grid.info(include_metadata=False).equals(grid_image.grid_finder.measure(grid_image))
+    assert np.array_equal(grid_image.grid.get_row_edges(), row_edges)
+
+    grid_image.objmap[:] = 0
+    grid_image.objmap[:20, :20] = 1
+    assert len(grid_image.grid.info(include_metadata=False)) == 1
+    assert grid_image.grid.info(include_metadata=False).equals(grid_image.grid_finder.measure(grid_image))
+
+    grid_image.grid.nrows = 4
+    assert len(grid_image.grid.get_row_edges()) == 5
+
+
+@timeit
+def test_grid_bin_assignment_matches_pandas_cut():
+    import pandas as pd
+    edges = np.array([0, 10, 20, 35])
+    positions = np.array([-1, 0, 0.5, 10, 10.5, 20, 34.9, 35, 36, np.nan])
+    assigned = AutoGridFinder._assign_bins(positions=positions, edges=edges, nbins=3)
+    expected = pd.cut(positions, bins=edges, labels=range(3), include_lowest=True, right=True)
+    assert pd.Series(assigned).equals(pd.Series(expected))
+
+    with pytest.raises(ValueError):
+        AutoGridFinder._assign_bins(positions=positions, edges=np.array([0, 10, 10, 35]), nbins=3)
+
+
+@timeit
+def test_grid_section_access(plate_grid_images_with_detection):
+    grid_image = plate_grid_images_with_detection
+    counts = grid_image.grid.get_section_counts()
+    section_num = int(counts.index[0])
+    row, col = divmod(section_num, grid_image.grid.ncols)
+
+    section = grid_image.grid[section_num]
+    assert section == grid_image.grid[row, col]
+    assert section.num_objects == counts.iloc[0]
+
+    with pytest.raises(IndexError):
+        grid_image.grid[grid_image.grid.nrows, 0]
+
+
+@timeit
+def test_grid_info_by_section(plate_grid_images_with_detection):
+    grid_image = plate_grid_images_with_detection
+    section_num = int(grid_image.grid.get_section_counts().index[0])
+    row, col = divmod(section_num, grid_image.grid.ncols)
+
+    by_number = grid_image.grid.get_info_by_section(section_num)
+    by_position = grid_image.grid.get_info_by_section((row, col))
+    assert not by_number.empty
+    assert by_position.equals(by_number)
+
+
+@timeit
+def test_grid_section_counts():
+    grid_image = GridImage(load_plate_12hr())
+    OtsuDetector().apply(grid_image, inplace=True)
+    sections = grid_image.grid.info().loc[:, str(GRID.SECTION_NUM)]
+
+    counts = grid_image.grid.get_section_counts()
+    # Sections with equal counts keep the order value_counts gives them
+    assert counts.duplicated().any()
+    assert counts.equals(sections.value_counts().sort_values(ascending=False))
+    assert counts.index.equals(sections.value_counts().sort_values(ascending=False).index)
+    assert grid_image.grid.get_section_counts(ascending=True).index.equals(
+            sections.value_counts().sort_values(ascending=True).index)
+
+
+@timeit
+def test_centroid_alignment_info_is_independent(plate_grid_images_with_detection):
+    grid_image = plate_grid_images_with_detection
+    m_slope, b_intercept = grid_image.grid.get_centroid_alignment_info(axis=0)
+    expected_slope, expected_intercept = m_slope.copy(), b_intercept.copy()
+
+    m_slope[:] = 0
+    b_intercept[:] = 0
+    m_slope, b_intercept = grid_image.grid.get_centroid_alignment_info(axis=0)
+    assert np.array_equal(m_slope, expected_slope, equal_nan=True)
+    assert np.array_equal(b_intercept, expected_intercept, equal_nan=True)
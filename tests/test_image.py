@@ -1,3 +1,6 @@
+from pathlib import Path
+import pytest
+
 import pandas as pd
 
 import numpy as np
@@ -91,10 +94,10 @@ def test_image_matrix_access(sample_image_array_with_imformat):
     input_image, input_imformat, true_imformat = sample_image_array_with_imformat
     ps_image = phenotypic.Image(arr=input_image)
     if not ps_image.rgb.isempty():
-        assert np.array_equal(ps_image.gray[:], skimage.color.rgb2gray(input_image)), \
+        # gray is stored in single precision, so compare against skimage within float32 resolution
+        assert ps_image.gray[:].dtype == np.float32
+        assert np.allclose(ps_image.gray[:], skimage.color.rgb2gray(input_image), atol=np.finfo(np.float32).eps), \
             f'Image.gray and skimage.color.rgb2gray do not match at {np.unique(ps_image.gray[:] != skimage.color.rgb2gray(input_image), return_counts=True)}'
-        # assert np.allclose(ps_image.gray[:], skimage.color.rgb2gray(arr), atol=1.0 / np.finfo(ps_image.gray[:].dtype).max),\
-        #     f'Image.gray and skimage.color.rgb2gray do not match at {np.unique(ps_image.gray[:] != skimage.color.rgb2gray(arr), return_counts=True)}'
     else:
         assert np.array_equal(ps_image.gray[:], input_image)
 
@@ -183,6 +186,23 @@ def test_image_copy(sample_image_array_with_imformat):
     assert np.array_equal(ps_image.objmap[:], ps_image_copy.objmap[:])
 
 
+@timeit
+def test_image_copy_objmap_is_independent(sample_image_array_with_imformat):
+    input_image, input_imformat, true_imformat = sample_image_array_with_imformat
+    ps_image = phenotypic.Image(arr=input_image)
+    ps_image.objmap[:5, :5] = 1
+    ps_image_copy = ps_image.copy()
+
+    ps_image_copy.objmap[:5, :5] = 2
+    ps_image_copy.objmap[5:10, 5:10] = 3
+    assert np.all(ps_image.objmap[:5, :5] == 1)
+    assert np.all(ps_image.objmap[5:10, 5:10] == 0)
+    assert ps_image.num_objects == 1
+
+    ps_image.objmask[:] = False
+    assert ps_image_copy.num_objects == 2
+
+
 @timeit
 def test_slicing(sample_image_array_with_imformat):
     input_image, input_imformat, true_imformat = sample_image_array_with_imformat
@@ -197,6 +217,21 @@ def test_slicing(sample_image_array_with_imformat):
     assert np.array_equal(sliced_ps_image.objmap[:], ps_image.objmap[:row_slice, :col_slice])
 
 
+@timeit
+def test_slicing_with_objects_and_enhancement(sample_image_array_with_imformat):
+    input_image, input_imformat, true_imformat = sample_image_array_with_imformat
+    ps_image = phenotypic.Image(arr=input_image)
+    ps_image.enh_gray[:] = ps_image.gray[:]/2
+    ps_image.objmap[2:6, 3:8] = 4
+    key = (slice(1, 12), slice(None, None, 2))
+    sliced_ps_image = ps_image[key]
+    assert np.array_equal(sliced_ps_image.gray[:], ps_image.gray[key])
+    assert np.array_equal(sliced_ps_image.enh_gray[:], ps_image.enh_gray[key])
+    assert np.array_equal(sliced_ps_image.objmap[:], ps_image.objmap[key])
+    sliced_ps_image.objmap[:] = 0
+    assert ps_image.num_objects == 1
+
+
 @timeit
 def test_image_object_size_label_consistency(sample_image_array_with_imformat):
     input_image, input_imformat, true_imformat = sample_image_array_with_imformat
@@ -249,6 +284,15 @@ def test_rgb_imsave_tiff(tmp_path):
     assert out.exists(), f"RGB TIFF file was not created at {out}"
 
 
+@timeit
+def test_imread_tiff_roundtrip(tmp_path):
+    out = tmp_path/"roundtrip.tif"
+    image = phenotypic.data.load_colony(mode='Image')
+    image.rgb.imsave(out)
+    loaded = phenotypic.Image.imread(out)
+    assert np.array_equal(loaded.rgb[:], image.rgb[:])
+
+
 @timeit
 def test_gray_imsave_jpg(tmp_path):
     out = tmp_path/"out_gray.jpg"
@@ -295,3 +339,179 @@ def test_enh_gray_imsave_tiff(tmp_path):
     image = phenotypic.data.load_colony(mode='Image')
     image.enh_gray.imsave(out)
     assert out.exists(), f"Enhanced Gray TIFF file was not created at {out}"
+
+
+@timeit
+def test_image_props_whole_image(sample_image_array_with_imformat):
+    input_image, input_imformat, true_imformat = sample_image_array_with_imformat
+    ps_image = phenotypic.Image(arr=input_image)
+    props = ps_image.props
+    assert len(props) == 1
+    assert props[0].area == ps_image.gray.shape[0]*ps_image.gray.shape[1]
+
+
+@timeit
+def test_imread_many_matches_imread():
+    data_dir = Path(phenotypic.data.__file__).parent
+    filepaths = [data_dir/'early_colony.png', data_dir/'later_colony.png', data_dir/'StandardDay1.jpg']
+    images = phenotypic.Image.imread_many(filepaths, n_jobs=2)
+    assert [image.name for image in images] == [fpath.stem for fpath in filepaths]
+    for image, fpath in zip(images, filepaths):
+        assert image == phenotypic.Image.imread(fpath)
+
+
+@pytest.mark.parametrize('n_jobs', [0, -2])
+def test_imread_many_rejects_invalid_n_jobs(n_jobs):
+    filepath = Path(phenotypic.data.__file__).parent/'early_colony.png'
+    with pytest.raises(ValueError, match='n_jobs'):
+        phenotypic.Image.imread_many([filepath], n_jobs=n_jobs)
+
+
+@timeit
+def test_set_image_from_buffer(sample_image_array_with_imformat):
+    input_image, input_imformat, true_imformat = sample_image_array_with_imformat
+    from_array = phenotypic.Image(arr=input_image)
+    from_buffer = phenotypic.Image()
+    from_buffer.set_image(input_image.tobytes(), shape=input_image.shape, dtype=input_image.dtype)
+    assert from_buffer == from_array
+
+    # the buffer-backed image owns writable data that is independent of the source array
+    from_buffer.gray[:] = 0
+    assert np.all(from_buffer.gray[:] == 0)
+    assert np.array_equal(from_array.gray[:], phenotypic.Image(arr=input_image).gray[:])
+
+
+@timeit
+def test_gray_deferred_on_color_input(sample_image_array_with_imformat):
+    input_image, input_imformat, true_imformat = sample_image_array_with_imformat
+    image = phenotypic.Image(arr=input_image)
+    if image.rgb.isempty():
+        return
+    assert image._data._gray is None
+    assert not image.isempty()
+    assert image.gray.shape == image.rgb.shape[:2]
+    assert image._data._gray is None
+    assert np.array_equal(image.gray[:], phenotypic.Image(arr=input_image).gray[:])
+    assert image._data._gray is not None
+
+
+@timeit
+def test_objmap_full_overwrite(sample_image_array_with_imformat):
+    input_image, input_imformat, true_imformat = sample_image_array_with_imformat
+    image = phenotypic.Image(arr=input_image)
+    labels = np.zeros(image.gray.shape, dtype=np.int64)
+    labels[1:4, 2:6] = 2
+    labels[-3:, -2:] = 7
+    image.objmap[:] = labels[:, ::-1]
+    assert np.array_equal(image.objmap[:], labels[:, ::-1])
+    assert image.objmap[:].dtype == np.uint16
+    assert image.num_objects == 2
+
+
+@timeit
+def test_image_equality_short_circuit(sample_image_array_with_imformat):
+    input_image, input_imformat, true_imformat = sample_image_array_with_imformat
+    image = phenotypic.Image(arr=input_image)
+    other = phenotypic.Image(arr=input_image)
+    assert image == other
+    assert image._data._enh_gray is None and other._data._enh_gray is None
+
+    other.objmap[0, 0] = 1
+    assert image != other
+    other.objmap[:] = 0
+    assert image == other
+
+    other.enh_gray[0, 0] = 1 - float(other.gray[:][0, 0])
+    assert image != other
+
+
+@timeit
+def test_objmap_reads_are_independent(sample_image_array_with_imformat):
+    input_image, input_imformat, true_imformat = sample_image_array_with_imformat
+    image = phenotypic.Image(arr=input_image)
+    image.objmap[1:3, 1:3] = 4
+
+    section = image.objmap[:]
+    section[0, 0] = 9
+    assert image.objmap[0, 0] == 0
+    assert image.num_objects == 1
+
+    image.objmask[:] = 0
+    assert image.objmap[:].sum() == 0
+    assert image.num_objects == 0
+
+
+@timeit
+def test_image_object_iteration_matches_indexing(sample_image_array_with_imformat):
+    input_image, input_imformat, true_imformat = sample_image_array_with_imformat
+    ps_image = phenotypic.Image(arr=input_image)
+    ps_image.objmap[:10, :10] = 1
+    ps_image.objmap[5:15, 5:15] = 2
+
+    crops = list(ps_image.objects)
+    assert len(crops) == 2
+    for idx, crop in enumerate(crops):
+        assert np.array_equal(crop.objmap[:], ps_image.objects[idx].objmap[:])
+    assert np.array_equal(np.unique(crops[0].objmap[:]), [0, 1])
+
+
+@timeit
+def test_object_info_cached_until_objmap_changes(sample_image_array_with_imformat):
+    input_image, input_imformat, true_imformat = sample_image_array_with_imformat
+    ps_image = phenotypic.Image(arr=input_image)
+    ps_image.objmap[:10, :10] = 1
+
+    info = ps_image.objects.info(include_metadata=False)
+    info.iloc[:, 0] = -1
+    assert ps_image.objects.info(include_metadata=False).iloc[0, 0] == 1
+
+    ps_image.objmap[-10:, -10:] = 2
+    assert len(ps_image.objects.info(include_metadata=False)) == 2
+
+
+@timeit
+def test_objmap_row_band_writes(sample_image_array_with_imformat):
+    input_image, input_imformat, true_imformat = sample_image_array_with_imformat
+    image = phenotypic.Image(arr=input_image)
+    expected = np.zeros(image.gray.shape, dtype=np.uint16)
+    expected[::3, ::2] = 5
+    image.objmap[:] = expected.copy()
+
+    for key, value in [((slice(2, 6), slice(1, 4)), 3), (slice(-3, None), 0),
+                       ((slice(None), slice(0, 2)), 9), ((slice(1, 2),), 0)]:
+        image.objmap[key] = value
+        expected[key] = value
+        assert np.array_equal(image._data.sparse_object_map.toarray(), expected)
+    assert np.all(image._data.sparse_object_map.data != 0)
+
+
+@timeit
+def test_array_interface_does_not_alias_image_data(sample_image_array_with_imformat):
+    input_image, input_imformat, true_imformat = sample_image_array_with_imformat
+    ps_image = phenotypic.Image(arr=input_image)
+    accessors = [ps_image.gray, ps_image.enh_gray]
+    if not ps_image.rgb.isempty():
+        accessors.append(ps_image.rgb)
+
+    for accessor in accessors:
+        before = accessor[:].copy()
+        with pytest.raises(ValueError):
+            np.asarray(accessor)[0] = 0
+        assert np.array_equal(accessor[:], before)
+        assert np.asarray(accessor, copy=True).flags.writeable
+
+
+@timeit
+def test_rotate_grays_independently():
+    # Sharp edges make cubic interpolation overshoot, so clipping to the wrong range is visible
+    gray = np.where((np.indices((64, 64))//8).sum(axis=0)%2 == 0, 0.25, 0.75)
+    ps_image = phenotypic.Image(arr=gray)
+    ps_image.enh_gray[:] = np.linspace(0.0, 1.0, 64*64).reshape(64, 64)[::-1]
+    enh_gray = ps_image.enh_gray[:].copy()
+
+    ps_image.rotate(angle_of_rotation=10, mode='edge', order=3)
+    expected_gray = skimage.transform.rotate(gray, angle=10, mode='edge', clip=True, order=3, preserve_range=True)
+    expected_enh = skimage.transform.rotate(enh_gray, angle=10, mode='edge', clip=True, order=3,
+                                            preserve_range=True)
+    assert np.allclose(ps_image.gray[:], expected_gray)
+    assert np.allclose(ps_image.enh_gray[:], expected_enh)
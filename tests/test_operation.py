@@ -1,10 +1,12 @@
 import pytest
 
-from phenotypic.abc_ import ImageOperation
+from phenotypic.abc_ import ImageOperation, ObjectRefiner
 
 import phenotypic
 from phenotypic.data import load_plate_12hr
 from phenotypic.detect import WatershedDetector
+from phenotypic.measure import MeasureBounds
+from phenotypic.tools.exceptions_ import OperationIntegrityError
 
 from .test_fixtures import _image_operations
 from .resources.TestHelper import timeit
@@ -18,3 +20,43 @@ def test_operation(qualname, obj):
     image = phenotypic.GridImage(load_plate_12hr())
     image = WatershedDetector().apply(image)
     assert obj().apply(image).isempty() is False
+
+
+class _MaskOnlyRefiner(ObjectRefiner):
+    def _operate(self, image):
+        image.objmask[:5, :5] = True
+        return image
+
+
+class _GrayReadingRefiner(ObjectRefiner):
+    def _operate(self, image):
+        image.objmask[:] = image.enh_gray[:] > image.enh_gray[:].mean()
+        return image
+
+
+class _GrayWritingRefiner(ObjectRefiner):
+    def _operate(self, image):
+        image._data.enh_gray = image.enh_gray[:] + 0.5
+        return image
+
+
+@timeit
+def test_integrity_checks_leave_lazy_components_unset():
+    image = phenotypic.Image(load_plate_12hr())
+    image = _MaskOnlyRefiner().apply(image, inplace=True)
+    assert image._data._gray is None
+    assert image._data._enh_gray is None
+    assert image.num_objects == 1
+
+    MeasureBounds().measure(image)
+    assert image._data._gray is None
+
+    # Creating a lazy component without changing it passes the check
+    assert _GrayReadingRefiner().apply(image).num_objects > 0
+
+
+@timeit
+def test_integrity_checks_catch_changes_to_lazy_components():
+    image = phenotypic.Image(load_plate_12hr())
+    with pytest.raises(OperationIntegrityError):
+        _GrayWritingRefiner().apply(image)